@@ -474,6 +474,28 @@ def _sentinel2_fmask(
     # TODO: Remove intermediates? toa, angles files
 
 
+def _list_directory_files(directory: Path):
+    """
+    Recursively list the files beneath `directory`, as posix paths
+    relative to it.
+    Uses `os.scandir`, whose entries carry their file type, rather
+    than a separate `stat` call for every path. Symlinked directories
+    aren't descended into, matching `Path.rglob`.
+    """
+    files = []
+    stack = [(os.fspath(directory), "")]
+    while stack:
+        current, prefix = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{prefix}{entry.name}/"))
+                elif entry.is_file():
+                    files.append(f"{prefix}{entry.name}")
+
+    return files
+
+
 class FileArchive:
     """A simple abstraction over zip/tar files, or directories."""
 
@@ -484,11 +506,7 @@ class FileArchive:
         # Our "archive" can be a directory, a zip file, or a tar file.
         if self.archive_path.is_dir():
             self.open_file = lambda p: open(self.archive_path / p, "rb")
-            self.files = [
-                p.relative_to(self.archive_path).as_posix()
-                for p in self.archive_path.rglob("*")
-                if p.is_file()
-            ]
+            self.files = _list_directory_files(self.archive_path)
         elif self.archive_path.suffix in [".zip"]:
             self._archive = zipfile.ZipFile(self.archive_path, "r")
             self.open_file = self._archive.open
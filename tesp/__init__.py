@@ -1,10 +1,5 @@
-try:
-    from importlib import metadata as _md
-except ImportError:
-    # Running on pre-3.8 Python; use importlib-metadata package
-    import importlib_metadata as _md
+# tesp is installed as part of the ard-pipeline distribution, so it shares
+# the version written to wagl at build time
+from wagl._version import __version__
 
-try:
-    __version__ = _md.version(__name__)
-except _md.PackageNotFoundError:
-    __version__ = "Not Installed"
+__all__ = ("__version__",)
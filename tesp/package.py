@@ -2,10 +2,10 @@
 # pylint: disable=too-many-locals
 
 import json
+import re
 import shutil
 import uuid
 from pathlib import Path
-from posixpath import join as ppjoin
 from typing import Tuple
 
 import eodatasets3.wagl
@@ -25,19 +25,57 @@ from yaml.representer import Representer
 
 from wagl.hdf5 import find
 
-yaml.add_representer(np.int8, Representer.represent_int)
-yaml.add_representer(np.uint8, Representer.represent_int)
-yaml.add_representer(np.int16, Representer.represent_int)
-yaml.add_representer(np.uint16, Representer.represent_int)
-yaml.add_representer(np.int32, Representer.represent_int)
-yaml.add_representer(np.uint32, Representer.represent_int)
-yaml.add_representer(int, Representer.represent_int)
-yaml.add_representer(np.int64, Representer.represent_int)
-yaml.add_representer(np.uint64, Representer.represent_int)
-yaml.add_representer(float, Representer.represent_float)
-yaml.add_representer(np.float32, Representer.represent_float)
-yaml.add_representer(np.float64, Representer.represent_float)
-yaml.add_representer(np.ndarray, Representer.represent_list)
+YAML_REPRESENTERS = {
+    np.int8: Representer.represent_int,
+    np.uint8: Representer.represent_int,
+    np.int16: Representer.represent_int,
+    np.uint16: Representer.represent_int,
+    np.int32: Representer.represent_int,
+    np.uint32: Representer.represent_int,
+    int: Representer.represent_int,
+    np.int64: Representer.represent_int,
+    np.uint64: Representer.represent_int,
+    float: Representer.represent_float,
+    np.float32: Representer.represent_float,
+    np.float64: Representer.represent_float,
+    np.ndarray: Representer.represent_list,
+}
+
+# only register the types that haven't already been registered in this process
+# (the builtins and anything installed by wagl.metadata)
+for _data_type, _representer in YAML_REPRESENTERS.items():
+    if _data_type not in yaml.Dumper.yaml_representers:
+        yaml.add_representer(_data_type, _representer)
+
+# level1 processing level within a granule name, and its ARD replacement
+PATTERN2 = re.compile(r"(L1[GTPCS]{1,2})")
+ARD = "ARD"
+
+# raw data chunk cache settings for reading the wagl HDF5 file whilst
+# packaging; a 256 MiB cache, a prime number of hash slots, and a
+# preference for evicting chunks that have been fully read
+WAGL_READ_CHUNK_CACHE = {
+    "rdcc_nbytes": 256 * 1024 * 1024,
+    "rdcc_nslots": 12_007,
+    "rdcc_w0": 0.75,
+}
+
+
+def _iter_bands(fid: h5py.File, pathnames):
+    """
+    Yield the name, attributes, chunks, datatype name and data of each
+    image dataset in `pathnames`, reading one dataset at a time.
+    Boolean datasets are yielded as uint8 to work with GDAL.
+    """
+    for pathname in pathnames:
+        ds = fid[pathname]
+        data = ds[:]
+        if ds.dtype.name == "bool":
+            # numpy bools are stored as single 0/1 bytes, so reinterpret
+            # the buffer rather than converting it
+            data = data.view(np.uint8)
+
+        yield ds.name, ds.attrs, ds.chunks, ds.dtype.name, data
 
 
 def package_non_standard(
@@ -63,14 +101,17 @@ def package_non_standard(
         da.producer = "ga.gov.au"
         da.properties["odc:file_format"] = "HDF5"
 
-        with h5py.File(input_hdf5, "r") as fid:
-            img_paths = [ppjoin(fid.name, pth) for pth in find(fid, "IMAGE")]
+        with h5py.File(input_hdf5, "r", **WAGL_READ_CHUNK_CACHE) as fid:
+            # find() returns names relative to the file root
+            img_paths = [f"/{pth}" for pth in find(fid, "IMAGE")]
             granule_group = fid[granule.name]
 
+            # filter the SCALAR listing in a single numpy pass
+            scalar_paths = np.asarray(find(granule_group, "SCALAR"), dtype=str)
+            metadata_mask = np.char.find(scalar_paths, "METADATA") >= 0
+
             try:
-                wagl_path, *ancil_paths = (
-                    pth for pth in find(granule_group, "SCALAR") if "METADATA" in pth
-                )
+                wagl_path, *ancil_paths = scalar_paths[metadata_mask].tolist()
             except ValueError:
                 raise ValueError("No nbar metadata found in granule")
 
@@ -106,7 +147,8 @@ def package_non_standard(
 
             with rasterio.open(fmask_img) as ds:
                 fmask_layer = f"/{granule.name}/OA_FMASK/oa_fmask"
-                data = ds.read(1)
+                # read straight into a preallocated array
+                data = ds.read(1, out=np.empty(ds.shape, dtype=ds.dtypes[0]))
                 fmask_ds = created_f.create_dataset(
                     fmask_layer, data=data, compression="lzf", shuffle=True
                 )
@@ -132,41 +174,41 @@ def package_non_standard(
                     measurement_name,
                     grid_spec,
                     boolean_h5,
-                    fmask_ds[:],
+                    data,
                     layer=f"/{fmask_layer}",
                     nodata=no_data,
                     expand_valid_data=False,
                 )
 
-            for pathname in img_paths:
-                ds = fid[pathname]
-                ds_path = Path(ds.name)
+            for ds_name, attrs, chunks, dtype_name, data in _iter_bands(fid, img_paths):
+                # eg ["", granule, resolution group, ..., parent, name]
+                ds_parts = ds_name.split("/")
 
                 # eodatasets internally uses this grid spec to group image datasets
                 grid_spec = images.GridSpec(
-                    shape=ds.shape,
-                    transform=Affine.from_gdal(*ds.attrs["geotransform"]),
-                    crs=CRS.from_wkt(ds.attrs["crs_wkt"]),
+                    shape=data.shape,
+                    transform=Affine.from_gdal(*attrs["geotransform"]),
+                    crs=CRS.from_wkt(attrs["crs_wkt"]),
                 )
 
                 # product group name; lambertian, nbar, nbart, oa
-                if "STANDARDISED-PRODUCTS" in str(ds_path):
-                    product_group = ds_path.parent.name
-                elif "INTERPOLATED-ATMOSPHERIC-COEFFICIENTS" in str(ds_path):
-                    product_group = f"oa_{ds_path.parent.name}"
+                if "STANDARDISED-PRODUCTS" in ds_name:
+                    product_group = ds_parts[-2]
+                elif "INTERPOLATED-ATMOSPHERIC-COEFFICIENTS" in ds_name:
+                    product_group = f"oa_{ds_parts[-2]}"
                 else:
                     product_group = "oa"
 
                 # spatial resolution group
                 # used to separate measurements with the same name
-                resolution_group = "rg{}".format(ds_path.parts[2].split("-")[-1])
+                resolution_group = "rg{}".format(ds_parts[2].split("-")[-1])
 
                 measurement_name = (
                     "_".join(
                         [
                             resolution_group,
                             product_group,
-                            ds.attrs.get("alias", ds_path.name),
+                            attrs.get("alias", ds_parts[-1]),
                         ]
                     )
                     .replace("-", "_")
@@ -174,30 +216,33 @@ def package_non_standard(
                 )  # we don't want hyphens in odc land
 
                 # include this band in defining the valid data bounds?
-                include = True if "nbart" in measurement_name else False
+                # eodatasets builds a single union mask per grid from these
+                # bands, but only uses it when no geometry was inherited from
+                # the source level1, so skip building it otherwise
+                include = "nbart" in measurement_name and da.geometry is None
 
-                no_data = ds.attrs.get("no_data_value")
+                no_data = attrs.get("no_data_value")
                 if no_data is None:
                     no_data = float("nan")
 
                 # if we are of type bool, we'll have to convert just for GDAL
-                if ds.dtype.name == "bool":
+                if dtype_name == "bool":
                     out_ds = created_f.create_dataset(
                         measurement_name,
-                        data=np.uint8(ds[:]),
+                        data=data,
                         compression="lzf",
                         shuffle=True,
-                        chunks=ds.chunks,
+                        chunks=chunks,
                     )
 
-                    for k, v in ds.attrs.items():
+                    for k, v in attrs.items():
                         out_ds.attrs[k] = v
 
                     da._measurements.record_image(
                         measurement_name,
                         grid_spec,
                         boolean_h5,
-                        out_ds[:],
+                        data,
                         layer=f"/{out_ds.name}",
                         nodata=no_data,
                         expand_valid_data=include,
@@ -208,8 +253,8 @@ def package_non_standard(
                         measurement_name,
                         grid_spec,
                         wagl_h5,
-                        ds[:],
-                        layer=f"/{ds.name}",
+                        data,
+                        layer=f"/{ds_name}",
                         nodata=no_data,
                         expand_valid_data=include,
                     )
@@ -9,7 +9,7 @@ import os
 import re
 import subprocess
 import uuid
-from os.path import dirname, exists
+from os.path import dirname
 from os.path import join as pjoin
 from pathlib import Path
 from typing import Optional, Set, Union
@@ -107,8 +107,9 @@ def _calc_nodes_req(granule_count, walltime, workers, hours_per_granule=1.5):
     >>> _calc_nodes_req(800, '20:00', 28)
     3
     """
-    hours, _, _ = (int(x) for x in walltime.split(":"))
-    return int(math.ceil(float(hours_per_granule * granule_count) / (hours * workers)))
+    # only the hours component is needed; guard against a zero hour walltime
+    hours = max(int(walltime.split(":", 1)[0]), 1)
+    return int(math.ceil(hours_per_granule * granule_count / (hours * workers)))
 
 
 def _get_projects_for_path(path: Path) -> Set[str]:
@@ -199,18 +200,16 @@ def _submit_multiple(
     # setup and submit each block of scenes for processing
     for block in scattered:
         jobid = uuid.uuid4().hex[0:6]
-        jobdir = pjoin(batch_logdir, FMT2.format(jobid=jobid))
-        job_outdir = pjoin(batch_outdir, FMT2.format(jobid=jobid))
+        fmt_jobid = FMT2.format(jobid=jobid)
+        jobdir = pjoin(batch_logdir, fmt_jobid)
+        job_outdir = pjoin(batch_outdir, fmt_jobid)
 
-        if not exists(jobdir):
-            os.makedirs(jobdir)
-
-        if not exists(job_outdir):
-            os.makedirs(job_outdir)
+        os.makedirs(jobdir, exist_ok=True)
+        os.makedirs(job_outdir, exist_ok=True)
 
         # write level1 data listing
         out_fname = pjoin(jobdir, FMT3.format(jobid=jobid))
-        with open(out_fname, "w") as src:
+        with open(out_fname, "w", buffering=1 << 20) as src:
             src.writelines(block)
 
         pbs = NODE_TEMPLATE.format(
@@ -2,9 +2,9 @@
 
 import csv
 import os
-import re
 import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from os.path import basename, exists
 from os.path import join as pjoin
 
@@ -178,9 +178,12 @@ class ExperimentGranule(luigi.Task):
     settings = luigi.DictParameter()
     cleanup = luigi.BoolParameter()
 
+    @cached_property
+    def _ard_granule(self):
+        return PATTERN2.sub(ARD, self.granule)
+
     def _output_folder(self):
-        granule = re.sub(PATTERN2, ARD, self.granule)
-        return pjoin(self.pkgdir, self.tag, granule)
+        return pjoin(self.pkgdir, self.tag, self._ard_granule)
 
     def _output_filename(self):
         return pjoin(self._output_folder(), "summary.csv")
@@ -3,9 +3,11 @@
 """A temporary workflow for processing S2 data into an ARD package."""
 
 import json
+import os
 import shutil
 import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from os.path import basename
 from os.path import join as pjoin
 from pathlib import Path
@@ -32,10 +34,14 @@ from wagl.singlefile_workflow import DataStandardisation
 
 QA_PRODUCTS = ["gqa", "fmask", "s2cloudless"]
 
+# task ids of Package tasks already known to be complete in this process
+_COMPLETED_PACKAGES = set()
+
 
 @luigi.Task.event_handler(luigi.Event.FAILURE)
 def on_failure(task, exception):
     """Capture any Task Failure here."""
+    _COMPLETED_PACKAGES.discard(task.task_id)
     TASK_LOGGER.exception(
         event="task-failure",
         task=task.get_task_family(),
@@ -62,6 +68,32 @@ def on_success(task):
     )
 
 
+@lru_cache(maxsize=None)
+def _platform_id(level1, acq_parser_hint):
+    """
+    The platform id of a level1 dataset, parsed once per dataset
+    rather than on every completeness check.
+    """
+    container = acquisitions(level1, hint=acq_parser_hint)
+    return container.get_all_acquisitions()[0].platform_id
+
+
+@lru_cache(maxsize=None)
+def _parse_level1_list(path, mtime_ns):
+    """
+    The non-empty, stripped lines of a level1 list file.
+    `mtime_ns` is only used as part of the cache key, so that
+    a modified file is re-read.
+    """
+    with open(path) as src:
+        return tuple(line.strip() for line in src if line.strip())
+
+
+def read_level1_list(path):
+    """Read a level1 list file, reusing the parsed result if it hasn't changed."""
+    return _parse_level1_list(path, os.stat(path).st_mtime_ns)
+
+
 class WorkDir(luigi.Task):
     """Initialises the working directory in a controlled manner.
     Alternatively this could be initialised upfront during the
@@ -91,9 +123,7 @@ class RunS2Cloudless(luigi.Task):
     dilation_size: int = luigi.IntParameter(default=s2cl.DILATION_SIZE)
 
     def platform_id(self):
-        container = acquisitions(self.level1, hint=self.acq_parser_hint)
-        sample_acq = container.get_all_acquisitions()[0]
-        return sample_acq.platform_id
+        return _platform_id(self.level1, self.acq_parser_hint)
 
     def complete(self):
         if not self.platform_id().startswith("SENTINEL"):
@@ -304,6 +334,18 @@ class Package(luigi.Task):
 
         return tasks
 
+    def complete(self):
+        # the scheduler re-checks completion many times per run; once the
+        # completion target exists, remember that rather than stat it again
+        if self.task_id in _COMPLETED_PACKAGES:
+            return True
+
+        if super().complete():
+            _COMPLETED_PACKAGES.add(self.task_id)
+            return True
+
+        return False
+
     def output(self):
         # temp work around. rather than duplicate the packaging logic
         # create a text file to act as a completion target
@@ -470,19 +512,27 @@ class ARDP(luigi.WrapperTask):
     acq_parser_hint: PackageIdentificationHint = luigi.OptionalParameter(default="")
     yamls_dir: str = luigi.OptionalParameter(default="")
 
-    def requires(self):
-        with open(self.level1_list) as src:
-            level1_list = [level1.strip() for level1 in src.readlines()]
+    @cached_property
+    def _packages(self):
+        """
+        The Package tasks for every level1 granule.
+        luigi calls `requires` several times per run (scheduling, and
+        `complete` for a WrapperTask), so only build these once.
+        """
+        level1_list = read_level1_list(self.level1_list)
 
         worker = list_packages(
             self.workdir, self.acq_parser_hint, self.pkgdir, self.yamls_dir
         )
 
-        executor = ThreadPoolExecutor()
-        futures = [executor.submit(worker, level1) for level1 in level1_list]
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(worker, level1) for level1 in level1_list]
+            return [
+                task for future in as_completed(futures) for task in future.result()
+            ]
 
-        for future in as_completed(futures):
-            yield from future.result()
+    def requires(self):
+        return self._packages
 
 
 if __name__ == "__main__":
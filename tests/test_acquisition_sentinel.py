@@ -40,18 +40,34 @@ class AcquisitionLoadZipTest(unittest.TestCase):
         assert len(container.get_acquisitions(group="RES-GROUP-1")) == 6
         assert len(container.get_acquisitions(group="RES-GROUP-2")) == 1
 
+    def test_load_acquisitions_not_shared(self):
+        # acquisitions cache their band data and are closed by their user,
+        # so each call must build its own
+        container1 = acquisitions(S2A_SCENE1)
+        container2 = acquisitions(S2A_SCENE1)
+        assert container1 is not container2
+        assert (
+            container1.get_all_acquisitions()[0]
+            is not container2.get_all_acquisitions()[0]
+        )
+
 
 class AcquisitionsContainerTestS2(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # parsing the zip archive and its metadata is the expensive part,
+        # and the containers are only read by the tests
+        cls.s2a_container = acquisitions(S2A_SCENE1)
+        cls.s2b_container = acquisitions(S2B_SCENE1)
+
     def test_groups_s2a_scene1(self):
-        container = acquisitions(S2A_SCENE1)
-        assert len(container.groups) == 3
+        assert len(self.s2a_container.groups) == 3
 
     def test_groups_s2b_scene1(self):
-        container = acquisitions(S2B_SCENE1)
-        assert len(container.groups) == 3
+        assert len(self.s2b_container.groups) == 3
 
     def test_granules_s2a_scene1(self):
-        container = acquisitions(S2A_SCENE1)
+        container = self.s2a_container
         assert len(container.granules) == 1
         assert (
             container.granules[0]
@@ -59,7 +75,7 @@ class AcquisitionsContainerTestS2(unittest.TestCase):
         )
 
     def test_granules_s2b_scene1(self):
-        container = acquisitions(S2B_SCENE1)
+        container = self.s2b_container
         assert len(container.granules) == 1
         assert (
             container.granules[0]
@@ -67,60 +83,33 @@ class AcquisitionsContainerTestS2(unittest.TestCase):
         )
 
 
-class Sentinel2AScene1AcquisitionTest(unittest.TestCase):
-    def setUp(self):
-        self.container = acquisitions(S2A_SCENE1)
-        self.acq = self.container.get_all_acquisitions()[0]
-
-    def test_type(self):
-        for acq in self.container.get_all_acquisitions():
-            assert isinstance(acq, Sentinel2aAcquisition)
-            assert acq.band_type == BandType.REFLECTIVE
-
-    def test_acquisition_datetime(self):
-        test_date = datetime.datetime(2017, 12, 7, 0, 22, 52, 127000)
-        for acq in self.container.get_all_acquisitions():
-            assert acq.acquisition_datetime == test_date
-
-    def test_sensor_id(self):
-        for acq in self.container.get_all_acquisitions():
-            assert acq.sensor_id == "MSI"
-
-    def test_platform_id(self):
-        for acq in self.container.get_all_acquisitions():
-            assert acq.platform_id == "SENTINEL_2A"
-
-    def test_samples(self):
-        assert self.acq.samples == 172
-
-    def test_lines(self):
-        assert self.acq.lines == 172
-
-    def test_spectral_filter_cfg(self):
-        assert self.acq.spectral_filter_name == "sentinel2a_all.flt"
-
-    def test_read(self):
-        assert self.acq.data()[70, 30] == 1083
-
-    def test_tzinfo(self):
-        for acq in self.container.get_all_acquisitions():
-            assert acq.acquisition_datetime, None
+class Sentinel2Scene1AcquisitionChecks:
+    """Checks shared by the Sentinel-2 scene tests; subclasses define
+    the scene and its expected values.
+    """
 
+    scene = None
+    acquisition_type = None
+    acquisition_datetime = None
+    platform_id = None
+    spectral_filter_name = None
+    # ((row_start, row_stop), (col_start, col_stop)) of a single pixel
+    pixel_window = None
+    pixel_value = None
 
-class Sentinel2BScene1AcquisitionTest(unittest.TestCase):
-    def setUp(self):
-        self.container = acquisitions(S2B_SCENE1)
-        self.acq = self.container.get_all_acquisitions()[0]
+    @classmethod
+    def setUpClass(cls):
+        cls.container = acquisitions(cls.scene)
+        cls.acq = cls.container.get_all_acquisitions()[0]
 
     def test_type(self):
         for acq in self.container.get_all_acquisitions():
-            assert isinstance(acq, Sentinel2bAcquisition)
+            assert isinstance(acq, self.acquisition_type)
             assert acq.band_type == BandType.REFLECTIVE
 
     def test_acquisition_datetime(self):
-        test_date = datetime.datetime(2017, 7, 19, 0, 2, 18, 457000)
         for acq in self.container.get_all_acquisitions():
-            assert acq.acquisition_datetime == test_date
+            assert acq.acquisition_datetime == self.acquisition_datetime
 
     def test_sensor_id(self):
         for acq in self.container.get_all_acquisitions():
@@ -128,7 +117,7 @@ class Sentinel2BScene1AcquisitionTest(unittest.TestCase):
 
     def test_platform_id(self):
         for acq in self.container.get_all_acquisitions():
-            assert acq.platform_id == "SENTINEL_2B"
+            assert acq.platform_id == self.platform_id
 
     def test_samples(self):
         assert self.acq.samples == 172
@@ -137,11 +126,36 @@ class Sentinel2BScene1AcquisitionTest(unittest.TestCase):
         assert self.acq.lines == 172
 
     def test_spectral_filter_cfg(self):
-        assert self.acq.spectral_filter_name == "sentinel2b_all.flt"
+        assert self.acq.spectral_filter_name == self.spectral_filter_name
 
     def test_read(self):
-        assert self.acq.data()[100, 100] == 2
+        # windowed read of the single pixel
+        assert self.acq.data(window=self.pixel_window)[0, 0] == self.pixel_value
 
     def test_tzinfo(self):
         for acq in self.container.get_all_acquisitions():
             assert acq.acquisition_datetime, None
+
+
+class Sentinel2AScene1AcquisitionTest(
+    Sentinel2Scene1AcquisitionChecks, unittest.TestCase
+):
+    scene = S2A_SCENE1
+    acquisition_type = Sentinel2aAcquisition
+    acquisition_datetime = datetime.datetime(2017, 12, 7, 0, 22, 52, 127000)
+    platform_id = "SENTINEL_2A"
+    spectral_filter_name = "sentinel2a_all.flt"
+    pixel_window = ((70, 71), (30, 31))
+    pixel_value = 1083
+
+
+class Sentinel2BScene1AcquisitionTest(
+    Sentinel2Scene1AcquisitionChecks, unittest.TestCase
+):
+    scene = S2B_SCENE1
+    acquisition_type = Sentinel2bAcquisition
+    acquisition_datetime = datetime.datetime(2017, 7, 19, 0, 2, 18, 457000)
+    platform_id = "SENTINEL_2B"
+    spectral_filter_name = "sentinel2b_all.flt"
+    pixel_window = ((100, 101), (100, 101))
+    pixel_value = 2
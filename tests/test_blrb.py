@@ -108,7 +108,7 @@ class BLRBTest(unittest.TestCase):
         b = interpolate_block(origin, shape, f, grid=None)
         # print '\n', b
 
-        assert np.max(b - a) < 1e-06
+        assert np.allclose(a, b, rtol=0, atol=1e-06)
 
     def test_interpolate_block_3(self):
         def f(i, j):
@@ -133,23 +133,8 @@ class BLRBTest(unittest.TestCase):
         b = interpolate_block(origin, shape, f, grid=None)
         # print '\n', b
 
-        assert np.max(b - a) < 1e-06
+        assert np.allclose(a, b, rtol=0, atol=1e-06)
 
 
-def the_suite():
-    """Returns a test suite of all the tests in this module."""
-    test_classes = [BLRBTest]
-
-    suite_list = map(unittest.defaultTestLoader.loadTestsFromTestCase, test_classes)
-
-    suite = unittest.TestSuite(suite_list)
-
-    return suite
-
-
-#
-# Run unit tests if in __main__
-#
-
 if __name__ == "__main__":
-    unittest.TextTestRunner(verbosity=2).run(the_suite())
+    unittest.main(verbosity=2)
@@ -8,11 +8,11 @@ import numpy as np
 import numpy.testing as npt
 import rasterio as rio
 from data import LS8_SCENE1
-from osgeo import gdal, osr
+from osgeo import gdal
 
 from wagl import unittesting_tools as ut
 from wagl.acquisition import acquisitions
-from wagl.geobox import GriddedGeoBox
+from wagl.geobox import GriddedGeoBox, spatial_reference
 
 affine.EPSILON = 1e-9
 affine.EPSILON2 = 1e-18
@@ -26,50 +26,57 @@ def getFlindersIsletGGB():
 
 
 class TestGriddedGeoBox(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # a small geobox shared by the basic property tests
+        cls.shape = (3, 2)
+        cls.origin = (150.0, -34.0)
+        cls.ggb = GriddedGeoBox(cls.shape, cls.origin)
+
+        # the test image and its geobox are only read by the tests
+        cls.img, cls.geobox = ut.create_test_image()
+
+        drv = gdal.GetDriverByName("MEM")
+        cls.gdal_ds = drv.Create("tmp.tif", cls.img.shape[1], cls.img.shape[0], 1, 1)
+        cls.gdal_ds.SetGeoTransform(cls.geobox.transform.to_gdal())
+        cls.gdal_ds.SetProjection(cls.geobox.crs.ExportToWkt())
+
+        # in-memory HDF5 dataset, written directly from the test image
+        cls.h5_fid = h5py.File("tmp.h5", "w", driver="core", backing_store=False)
+        cls.h5_ds = cls.h5_fid.create_dataset("test", cls.img.shape, cls.img.dtype)
+        cls.h5_ds.write_direct(cls.img)
+        cls.h5_ds.attrs["geotransform"] = cls.geobox.transform.to_gdal()
+        cls.h5_ds.attrs["crs_wkt"] = cls.geobox.crs.ExportToWkt()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.gdal_ds = None
+        cls.h5_fid.close()
+
     def test_create_shape(self):
-        shape = (3, 2)
-        origin = (150.0, -34.0)
-        ggb = GriddedGeoBox(shape, origin)
-        assert shape == ggb.shape
+        assert self.shape == self.ggb.shape
 
     def test_get_shape_xy(self):
-        shape = (3, 2)
         shape_xy = (2, 3)
-        origin = (150.0, -34.0)
-        ggb = GriddedGeoBox(shape, origin)
-        assert shape_xy == ggb.get_shape_xy()
+        assert shape_xy == self.ggb.get_shape_xy()
 
     def test_get_shape_yx(self):
-        shape = (3, 2)
-        origin = (150.0, -34.0)
-        ggb = GriddedGeoBox(shape, origin)
-        assert shape == ggb.get_shape_yx()
+        assert self.shape == self.ggb.get_shape_yx()
 
     def test_x_size(self):
-        shape = (3, 2)
-        origin = (150.0, -34.0)
-        ggb = GriddedGeoBox(shape, origin)
-        assert shape[1] == ggb.x_size()
+        assert self.shape[1] == self.ggb.x_size()
 
     def test_y_size(self):
-        shape = (3, 2)
-        origin = (150.0, -34.0)
-        ggb = GriddedGeoBox(shape, origin)
-        assert shape[0] == ggb.y_size()
+        assert self.shape[0] == self.ggb.y_size()
 
     def test_create_origin(self):
-        shape = (3, 2)
-        origin = (150.0, -34.0)
-        ggb = GriddedGeoBox(shape, origin)
-        assert origin == ggb.origin
+        assert self.origin == self.ggb.origin
 
     def test_create_corner(self):
         scale = 0.00025
-        shape = (3, 2)
-        origin = (150.0, -34.0)
+        shape, origin = self.shape, self.origin
         corner = (shape[1] * scale + origin[0], origin[1] - shape[0] * scale)
-        ggb = GriddedGeoBox(shape, origin)
-        assert corner == ggb.corner
+        assert corner == self.ggb.corner
 
     def test_shape_create_unit_GGB_using_corners(self):
         # create small GGB centred on (150.00025,-34.00025)
@@ -144,7 +151,7 @@ class TestGriddedGeoBox(unittest.TestCase):
         self.assertAlmostEqual(cornerShouldBe[1], ggb.corner[1])
 
     def test_ggb_transform_from_rio_dataset(self):
-        img, geobox = ut.create_test_image()
+        img, geobox = self.img, self.geobox
         kwargs = {
             "driver": "MEM",
             "width": img.shape[1],
@@ -161,7 +168,7 @@ class TestGriddedGeoBox(unittest.TestCase):
             assert new_geobox.transform == geobox.transform
 
     def test_ggb_crs_from_rio_dataset(self):
-        img, geobox = ut.create_test_image()
+        img, geobox = self.img, self.geobox
         kwargs = {
             "driver": "MEM",
             "width": img.shape[1],
@@ -178,7 +185,7 @@ class TestGriddedGeoBox(unittest.TestCase):
             assert new_geobox.crs.ExportToWkt() == geobox.crs.ExportToWkt()
 
     def test_ggb_shape_from_rio_dataset(self):
-        img, geobox = ut.create_test_image()
+        img, geobox = self.img, self.geobox
         kwargs = {
             "driver": "MEM",
             "width": img.shape[1],
@@ -195,77 +202,35 @@ class TestGriddedGeoBox(unittest.TestCase):
             assert new_geobox.shape == img.shape
 
     def test_ggb_transform_from_gdal_dataset(self):
-        img, geobox = ut.create_test_image()
-        drv = gdal.GetDriverByName("MEM")
-        ds = drv.Create("tmp.tif", img.shape[1], img.shape[0], 1, 1)
-        ds.SetGeoTransform(geobox.transform.to_gdal())
-        ds.SetProjection(geobox.crs.ExportToWkt())
-
-        new_geobox = GriddedGeoBox.from_gdal_dataset(ds)
-        assert new_geobox.transform == geobox.transform
-        drv = None
-        ds = None
+        new_geobox = GriddedGeoBox.from_gdal_dataset(self.gdal_ds)
+        assert new_geobox.transform == self.geobox.transform
 
     def test_ggb_crs_from_gdal_dataset(self):
-        img, geobox = ut.create_test_image()
-        drv = gdal.GetDriverByName("MEM")
-        ds = drv.Create("tmp.tif", img.shape[1], img.shape[0], 1, 1)
-        ds.SetGeoTransform(geobox.transform.to_gdal())
-        ds.SetProjection(geobox.crs.ExportToWkt())
-
-        new_geobox = GriddedGeoBox.from_gdal_dataset(ds)
-        assert new_geobox.crs.ExportToWkt() == geobox.crs.ExportToWkt()
-        drv = None
-        ds = None
+        new_geobox = GriddedGeoBox.from_gdal_dataset(self.gdal_ds)
+        assert new_geobox.crs.ExportToWkt() == self.geobox.crs.ExportToWkt()
 
     def test_ggb_shape_from_gdal_dataset(self):
-        img, geobox = ut.create_test_image()
-        drv = gdal.GetDriverByName("MEM")
-        ds = drv.Create("tmp.tif", img.shape[1], img.shape[0], 1, 1)
-        ds.SetGeoTransform(geobox.transform.to_gdal())
-        ds.SetProjection(geobox.crs.ExportToWkt())
-
-        new_geobox = GriddedGeoBox.from_gdal_dataset(ds)
-        assert new_geobox.shape == img.shape
-        drv = None
-        ds = None
+        new_geobox = GriddedGeoBox.from_gdal_dataset(self.gdal_ds)
+        assert new_geobox.shape == self.img.shape
 
     def test_ggb_transform_from_h5_dataset(self):
-        img, geobox = ut.create_test_image()
-        with h5py.File("tmp.h5", "w", driver="core", backing_store=False) as fid:
-            ds = fid.create_dataset("test", data=img)
-            ds.attrs["geotransform"] = geobox.transform.to_gdal()
-            ds.attrs["crs_wkt"] = geobox.crs.ExportToWkt()
-
-            new_geobox = GriddedGeoBox.from_h5_dataset(ds)
-            assert new_geobox.transform == geobox.transform
+        new_geobox = GriddedGeoBox.from_h5_dataset(self.h5_ds)
+        assert new_geobox.transform == self.geobox.transform
 
     def test_ggb_crs_from_h5_dataset(self):
-        img, geobox = ut.create_test_image()
-        with h5py.File("tmp.h5", "w", driver="core", backing_store=False) as fid:
-            ds = fid.create_dataset("test", data=img)
-            ds.attrs["geotransform"] = geobox.transform.to_gdal()
-            ds.attrs["crs_wkt"] = geobox.crs.ExportToWkt()
-
-            new_geobox = GriddedGeoBox.from_h5_dataset(ds)
-            assert new_geobox.crs.ExportToWkt() == geobox.crs.ExportToWkt()
+        new_geobox = GriddedGeoBox.from_h5_dataset(self.h5_ds)
+        assert new_geobox.crs.ExportToWkt() == self.geobox.crs.ExportToWkt()
 
     def test_ggb_shape_from_h5_dataset(self):
-        img, geobox = ut.create_test_image()
-        with h5py.File("tmp.h5", "w", driver="core", backing_store=False) as fid:
-            ds = fid.create_dataset("test", data=img)
-            ds.attrs["geotransform"] = geobox.transform.to_gdal()
-            ds.attrs["crs_wkt"] = geobox.crs.ExportToWkt()
-
-            new_geobox = GriddedGeoBox.from_h5_dataset(ds)
-            assert new_geobox.shape == img.shape
+        new_geobox = GriddedGeoBox.from_h5_dataset(self.h5_ds)
+        assert new_geobox.shape == self.img.shape
 
     def test_convert_coordinate_to_map(self):
         """Test that an input image/array co-ordinate is correctly
         converted to a map co-cordinate.
         Simple case: The first pixel.
         """
-        _, geobox = ut.create_test_image()
+        geobox = self.geobox
         xmap, ymap = geobox.convert_coordinates((0, 0))
         assert geobox.origin == (xmap, ymap)
 
@@ -274,7 +239,7 @@ class TestGriddedGeoBox(unittest.TestCase):
         converted to a map co-cordinate.
         Simple case: The first pixel.
         """
-        _, geobox = ut.create_test_image()
+        geobox = self.geobox
         ximg, yimg = geobox.convert_coordinates(geobox.origin, to_map=False)
         assert (0, 0) == (ximg, yimg)
 
@@ -283,7 +248,7 @@ class TestGriddedGeoBox(unittest.TestCase):
         converted to a map co-cordinate using a pixel centre offset.
         Simple case: The first pixel.
         """
-        _, geobox = ut.create_test_image()
+        geobox = self.geobox
         xmap, ymap = geobox.convert_coordinates((0, 0), centre=True)
 
         # Get the actual centre co-ordinate of the first pixel
@@ -302,8 +267,7 @@ class TestGriddedGeoBox(unittest.TestCase):
         truth = np.array(values)
 
         # set up CRS; WGS84 Geographics
-        crs = osr.SpatialReference()
-        crs.SetFromUserInput("EPSG:4326")
+        crs = spatial_reference("EPSG:4326")
 
         # load the acquisition, get geobox, compute extents
         acq_cont = acquisitions(LS8_SCENE1)
@@ -328,8 +292,7 @@ class TestGriddedGeoBox(unittest.TestCase):
         lon = 148.862561
         lat = -35.123064
 
-        to_crs = osr.SpatialReference()
-        to_crs.ImportFromEPSG(32755)
+        to_crs = spatial_reference("EPSG:32755")
 
         easting, northing = ggb.transform_coordinates((lon, lat), to_crs)
 
@@ -353,14 +316,36 @@ class TestGriddedGeoBox(unittest.TestCase):
         easting = 669717.105361586
         northing = 6111722.038508673
 
-        to_crs = osr.SpatialReference()
-        to_crs.ImportFromEPSG(4326)
+        to_crs = spatial_reference("EPSG:4326")
 
         lon, lat = ggb.transform_coordinates((easting, northing), to_crs)
 
         self.assertAlmostEqual(lon, 148.862561)
         self.assertAlmostEqual(lat, -35.123064)
 
+    def test_lonlat_to_utm_many(self):
+        """Test that arrays of coordinates are transformed in bulk,
+        and agree with the single point transformation.
+        """
+        shape = (3, 2)
+        origin = (150.0, -34.0)
+        ggb = GriddedGeoBox(shape, origin)
+
+        lons = np.array([148.862561, 149.0, 149.5])
+        lats = np.array([-35.123064, -35.0, -34.5])
+
+        to_crs = spatial_reference("EPSG:32755")
+
+        eastings, northings = ggb.transform_coordinates_many(lons, lats, to_crs)
+
+        self.assertAlmostEqual(eastings[0], 669717.105361586)
+        self.assertAlmostEqual(northings[0], 6111722.038508673)
+
+        for lon, lat, easting, northing in zip(lons, lats, eastings, northings):
+            expected = ggb.transform_coordinates((lon, lat), to_crs)
+            self.assertAlmostEqual(easting, expected[0])
+            self.assertAlmostEqual(northing, expected[1])
+
     # def test_pixelscale_metres(self):
     #     scale = 0.00025
     #     shape = (4000, 4000)
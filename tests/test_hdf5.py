@@ -4,6 +4,7 @@
 
 import datetime
 import unittest
+from io import BytesIO
 
 import h5py
 import numpy as np
@@ -17,11 +18,7 @@ class HDF5Test(unittest.TestCase):
     """Test the various utilites contained in the wagl.hdf5 module."""
 
     scalar_data = 66
-    image_data = np.random.randint(0, 256, (10, 10))
     table_dtype = np.dtype([("float_data", "float64"), ("integer_data", "int64")])
-    table_data = np.zeros((10), dtype=table_dtype)
-    table_data["float_data"] = np.random.ranf(10)
-    table_data["integer_data"] = np.random.randint(0, 10001, (10))
 
     lzf_default = {
         "compression": "lzf",
@@ -100,7 +97,13 @@ class HDF5Test(unittest.TestCase):
         "compression_opts": (0, 0, 0, 0, 4, 1, 5),
     }
 
-    memory_kwargs = {"driver": "core", "backing_store": False}
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.image_data = rng.integers(0, 256, (10, 10), dtype=np.uint8)
+        cls.table_data = np.zeros((10), dtype=cls.table_dtype)
+        cls.table_data["float_data"] = rng.random(10)
+        cls.table_data["integer_data"] = rng.integers(0, 10001, (10))
 
     def test_lzf_default(self):
         """Test the default lzf compression settings."""
@@ -162,8 +165,7 @@ class HDF5Test(unittest.TestCase):
     def test_write_scalar(self):
         """Test the write_scalar function."""
         data = self.scalar_data
-        fname = "test_write_scalar.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             assert hdf5.write_scalar(data, "scalar", fid) is None
 
     def test_scalar_attributes(self):
@@ -175,8 +177,7 @@ class HDF5Test(unittest.TestCase):
         for k, v in attrs.items():
             data[k] = v
 
-        fname = "test_scalar_dataset.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             hdf5.write_scalar(data["value"], "test-scalar", fid, attrs=attrs)
 
             self.assertDictEqual(hdf5.read_scalar(fid, "test-scalar"), data)
@@ -187,8 +188,7 @@ class HDF5Test(unittest.TestCase):
         """
         attrs = {"timestamp": datetime.datetime.now()}
 
-        fname = "test_datetime_attrs.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             hdf5.write_scalar(self.scalar_data, "scalar", fid, attrs=attrs)
 
             data = hdf5.read_scalar(fid, "scalar")
@@ -198,8 +198,7 @@ class HDF5Test(unittest.TestCase):
         """Test the attach_attributes function."""
         attrs = {"alpha": 1, "beta": 2}
 
-        fname = "test_attach_attributes.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             dset = fid.create_dataset("data", data=self.image_data)
             hdf5.attach_attributes(dset, attrs)
             test = dict(dset.attrs.items())
@@ -208,23 +207,20 @@ class HDF5Test(unittest.TestCase):
     def test_write_h5_image(self):
         """Test the write_h5_image function."""
         data = self.image_data
-        fname = "test_write_h5_image.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             assert hdf5.write_h5_image(data, "image", fid) is None
 
     def test_write_h5_table(self):
         """Test the write_h5_table function."""
         data = self.table_data
-        fname = "test_write_h5_table.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             assert hdf5.write_h5_table(data, "table", fid) is None
 
     def test_attach_image_attributes(self):
         """Test the attach_image_attributes function."""
         attrs = {"CLASS": "IMAGE", "IMAGE_VERSION": "1.2", "DISPLAY_ORIGIN": "UL"}
 
-        fname = "test_attach_image_attributes.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             dset = fid.create_dataset("data", data=self.image_data)
             hdf5.attach_image_attributes(dset, attrs)
             test = dict(dset.attrs.items())
@@ -234,8 +230,7 @@ class HDF5Test(unittest.TestCase):
         """Test the image attributes of the write_h5_image function."""
         attrs = {"CLASS": "IMAGE", "IMAGE_VERSION": "1.2", "DISPLAY_ORIGIN": "UL"}
 
-        fname = "test_write_h5_image_attributes.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             hdf5.write_h5_image(self.image_data, "image", fid)
             test = dict(fid["image"].attrs.items())
 
@@ -248,8 +243,7 @@ class HDF5Test(unittest.TestCase):
         """Test the IMAGE_MINMAXRANGE attribute is correct."""
         minmax = np.array([self.image_data.min(), self.image_data.max()])
 
-        fname = "test_write_h5_image_minmax.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             hdf5.write_h5_image(self.image_data, "image", fid)
 
             test = fid["image"].attrs["IMAGE_MINMAXRANGE"]
@@ -266,8 +260,7 @@ class HDF5Test(unittest.TestCase):
             dataset[bname] = self.image_data
         minmax = np.array([self.image_data.min(), self.image_data.max()])
 
-        fname = "test_write_h5_multi.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             hdf5.write_h5_image(dataset, "image", fid)
 
             assert "IMAGE_MINMAXRANGE" not in fid["image"].attrs
@@ -286,8 +279,7 @@ class HDF5Test(unittest.TestCase):
             "FIELD_1_NAME": "integer_data",
         }
 
-        fname = "test_attach_table_attributes.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             dset = fid.create_dataset("data", data=self.table_data)
             hdf5.attach_table_attributes(dset, attrs=attrs)
             test = dict(dset.attrs.items())
@@ -296,8 +288,7 @@ class HDF5Test(unittest.TestCase):
     def test_write_dataframe(self):
         """Test the write_dataframe function."""
         df = pd.DataFrame(self.table_data)
-        fname = "test_write_dataframe.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             assert hdf5.write_dataframe(df, "dataframe", fid) is None
 
     def test_dataframe_attributes(self):
@@ -320,13 +311,33 @@ class HDF5Test(unittest.TestCase):
 
         df = pd.DataFrame(self.table_data)
 
-        fname = "test_dataframe_attributes.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             hdf5.write_dataframe(df, "dataframe", fid)
 
             test = dict(fid["dataframe"].attrs.items())
             self.assertDictEqual(test, attrs)
 
+    def test_dataframe_table_attributes(self):
+        """Test that a structured array written with the dataframe
+        table attributes matches, and reads back as, a written dataframe.
+        """
+        df = pd.DataFrame(self.table_data)
+        dtype = np.dtype([("index", "int64"), *self.table_dtype.descr])
+        data = np.empty(df.shape[0], dtype=dtype)
+        data["index"] = df.index
+        for name in self.table_dtype.names:
+            data[name] = df[name]
+
+        with h5py.File(BytesIO(), "w") as fid:
+            hdf5.write_dataframe(df, "dataframe", fid)
+            attrs = hdf5.dataframe_table_attributes(dtype, ["index"], data.shape[0])
+            hdf5.write_h5_table(data, "table", fid, attrs=attrs)
+
+            expected = dict(fid["dataframe"].attrs.items())
+            test = dict(fid["table"].attrs.items())
+            self.assertDictEqual(test, expected)
+            assert df.equals(hdf5.read_h5_table(fid, "table"))
+
     def test_dataframe_roundtrip(self):
         """Test that the pandas dataframe roundtrips, i.e. save to HDF5
         and is read back into a dataframe seamlessly.
@@ -337,8 +348,7 @@ class HDF5Test(unittest.TestCase):
         df["timestamps"] = pd.date_range("1/1/2000", periods=10, freq="D", tz="UTC")
         df["string_data"] = [f"period {i}" for i in range(10)]
 
-        fname = "test_dataframe_roundtrip.h5"
-        with h5py.File(fname, "w", **self.memory_kwargs) as fid:
+        with h5py.File(BytesIO(), "w") as fid:
             hdf5.write_dataframe(df, "dataframe", fid)
             # Apply conversion to no timezone that occurs in serialisation to hdf5
             # Numpy is timezone naive; pandas has timezone support
@@ -2,7 +2,13 @@ import unittest
 
 import numpy as np
 
-from wagl.interpolation import bilinear, interpolate_block, interpolate_grid, subdivide
+from wagl.interpolation import (
+    bilinear,
+    bilinear_out,
+    interpolate_block,
+    interpolate_grid,
+    subdivide,
+)
 
 
 class TestBilinearFnc(unittest.TestCase):
@@ -15,6 +21,17 @@ class TestBilinearFnc(unittest.TestCase):
         result = bilinear(in_arr.shape, 0, 9, 99, 90)
         assert np.allclose(result, expected)
 
+    def test_bilinear_out(self):
+        """Interpolate into a view of a larger array."""
+        expected = np.arange(0, 100, dtype=np.float64).reshape(10, 10)
+
+        grid = np.zeros((12, 12), dtype=np.float64)
+
+        result = bilinear_out(grid[1:11, 2:12], 0, 9, 99, 90)
+        assert np.allclose(result, expected)
+        assert np.allclose(grid[1:11, 2:12], expected)
+        assert not grid[0].any() and not grid[:, :2].any()
+
 
 class TestSubdivideFnc(unittest.TestCase):
     def test_subdivide(self):
@@ -85,3 +102,17 @@ class TestInterpolateGrid(unittest.TestCase):
         depth = 10
         interpolate_grid(result, eval_func, depth)
         assert np.allclose(result, in_arr)
+
+    def test_interpolate_grid_vectorized(self):
+        """Test a vectorized evaluator gives the same grid as a scalar one."""
+
+        def eval_func(y, x):
+            return np.sqrt(y + 1.0) * np.log(x + 2.0)
+
+        shape = (37, 53)
+        result = np.zeros(shape)
+        interpolate_grid(result, eval_func, 3, shape=shape)
+
+        vectorized = np.zeros(shape)
+        interpolate_grid(vectorized, eval_func, 3, shape=shape, vectorized=True)
+        assert np.allclose(result, vectorized)
@@ -6,7 +6,6 @@ from os.path import join as pjoin
 from posixpath import join as ppjoin
 
 import h5py
-import numpy as np
 import numpy.testing as npt
 from osgeo import osr
 
@@ -22,6 +21,21 @@ DATA_DIR = pjoin(dirname(abspath(__file__)), "data")
 LS5_SCENE1 = pjoin(DATA_DIR, "LANDSAT5", "LS5_TM_OTH_P51_GALPGS01-002_090_081_20090407")
 
 
+def reproject_pixels(geobox, ids, crs=CRS):
+    """Reproject the centres of the pixel locations `ids` ((y, x) index
+    arrays) to `crs`, returning the (x, y) co-ordinates as two arrays.
+    """
+    # Convert pixel centres to map co-ordinates in a single pass
+    map_x, map_y = geobox.convert_coordinates_vec(*ids, centre=True)
+
+    # We'll transform (reproject) to WGS84
+    sr = osr.SpatialReference()
+    sr.SetFromUserInput(crs)
+
+    # Transform all map co-ordinates to the other crs in one call
+    return geobox.transform_coordinates_many(map_x, map_y, to_crs=sr)
+
+
 class TestLonLatArrays(unittest.TestCase):
     def test_lon_array(self):
         """Test that the interpolated longitude array has sensible
@@ -46,24 +60,8 @@ class TestLonLatArrays(unittest.TestCase):
         lon = fid[dataset_name][:]
         ids = ut.random_pixel_locations(lon.shape)
 
-        # We'll transform (reproject) to WGS84
-        sr = osr.SpatialReference()
-        sr.SetFromUserInput(CRS)
-
-        # Get a list of x reprojected co-ordinates
-        reprj = []
-        for i in range(ids[0].shape[0]):
-            # Get pixel (x,y)
-            xy = (ids[1][i], ids[0][i])
-
-            # Convert pixel to map
-            mapXY = geobox.convert_coordinates(xy, centre=True)
-
-            # Transform map to another crs
-            x, _ = geobox.transform_coordinates(mapXY, to_crs=sr)
-            reprj.append(x)
-
-        reprj = np.array(reprj)
+        # Reproject the pixel centres, keeping the x co-ordinates
+        reprj, _ = reproject_pixels(geobox, ids)
 
         lon_values = lon[ids]
 
@@ -92,22 +90,8 @@ class TestLonLatArrays(unittest.TestCase):
         lat = fid[dataset_name][:]
         ids = ut.random_pixel_locations(lat.shape)
 
-        # We'll transform (reproject) to WGS84
-        sr = osr.SpatialReference()
-        sr.SetFromUserInput(CRS)
-
-        # Get a list of the y reprojected co-ordinates
-        reprj = []
-        for i in range(ids[0].shape[0]):
-            # Get pixel (x,y)
-            xy = (ids[1][i], ids[0][i])
-            # Convert pixel to map
-            mapXY = geobox.convert_coordinates(xy, centre=True)
-            # Transform map to another crs
-            _, y = geobox.transform_coordinates(mapXY, to_crs=sr)
-            reprj.append(y)
-
-        reprj = np.array(reprj)
+        # Reproject the pixel centres, keeping the y co-ordinates
+        _, reprj = reproject_pixels(geobox, ids)
 
         lat_values = lat[ids]
 
@@ -9,6 +9,8 @@ from wagl.modtran_profiles import MIDLAT_SUMMER_ALBEDO, MIDLAT_SUMMER_TRANSMITTA
 
 DATA_DIR = pjoin(dirname(abspath(__file__)), "data")
 
+WHITESPACE = re.compile(r"\s+")
+
 
 def assert_similar_str(input1: str, input2: str):
     input1 = remove_duplicate_whitespace(input1)
@@ -17,7 +19,7 @@ def assert_similar_str(input1: str, input2: str):
 
 
 def remove_duplicate_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return WHITESPACE.sub(" ", s).strip()
 
 
 class Tp5ReformatTest(unittest.TestCase):
@@ -30,7 +32,7 @@ class Tp5ReformatTest(unittest.TestCase):
         self.maxDiff = None
 
         with open(pjoin(DATA_DIR, "TL_alb_0.tp5")) as src:
-            ref_albedo = "".join(src.readlines())
+            ref_albedo = src.read()
 
         with tempfile.TemporaryDirectory() as tmpdir:
             out_fname = pjoin(tmpdir, "test-midlat-summer.tp5")
@@ -55,7 +57,7 @@ class Tp5ReformatTest(unittest.TestCase):
                 src.write(MIDLAT_SUMMER_ALBEDO.format(**kwargs))
 
             with open(out_fname) as src:
-                test_albedo = "".join(src.readlines())
+                test_albedo = src.read()
 
         assert_similar_str(test_albedo, ref_albedo)
 
@@ -64,7 +66,7 @@ class Tp5ReformatTest(unittest.TestCase):
         self.maxDiff = None
 
         with open(pjoin(DATA_DIR, "TL_alb_t.tp5")) as src:
-            ref_trans = "".join(src.readlines())
+            ref_trans = src.read()
 
         with tempfile.TemporaryDirectory() as tmpdir:
             out_fname = pjoin(tmpdir, "test-midlat-summer-trans.tp5")
@@ -86,7 +88,7 @@ class Tp5ReformatTest(unittest.TestCase):
                 src.write(MIDLAT_SUMMER_TRANSMITTANCE.format(**kwargs))
 
             with open(out_fname) as src:
-                test_trans = "".join(src.readlines())
+                test_trans = src.read()
 
         assert_similar_str(test_trans, ref_trans)
 
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
-import runpy
+import re
 from pathlib import Path
 
+VERSION_PATTERN = re.compile(r"""^__version__\s*=\s*['"]([^'"]+)['"]""", re.MULTILINE)
+
 # Find script directory and locate _version.py
 script_dir = Path(__file__).resolve().parent
 version_path = script_dir.parent / "wagl" / "_version.py"
 
-# Run the _version.py script and get its namespace
-version_info = runpy.run_path(version_path)
+# Read the version string without executing _version.py
+match = VERSION_PATTERN.search(version_path.read_text())
+if match is None:
+    raise SystemExit(f"No __version__ found in {version_path}")
 
-print(version_info["__version__"])
+print(match.group(1))
@@ -16,6 +16,8 @@ import re
 import tarfile
 import zipfile
 from collections import OrderedDict
+from functools import lru_cache
+from operator import methodcaller
 from os.path import basename, commonpath, dirname, isdir, isfile, splitext
 from os.path import join as pjoin
 from typing import List, Literal, Optional, Tuple
@@ -56,8 +58,40 @@ LANDSATMTLMAP = {
     },
 }
 
-with open(pjoin(dirname(__file__), "sensors.json")) as fo:
-    SENSORS = json.load(fo)
+
+# MTL groups that hold the values which aren't covered by LANDSATMTLMAP,
+# for each of the MTL layouts (pre-collection, C1, C2)
+MTL_LOOKUP_GROUPS = {
+    "sun_azimuth": ("IMAGE_ATTRIBUTES", "PRODUCT_PARAMETERS"),
+    "sun_elevation": ("IMAGE_ATTRIBUTES", "PRODUCT_PARAMETERS"),
+    "landsat_scene_id": ("METADATA_FILE_INFO", "LEVEL1_PROCESSING_RECORD"),
+}
+
+
+@lru_cache(maxsize=None)
+def _sensors():
+    """The sensor band configurations, read on first use."""
+    with open(pjoin(dirname(__file__), "sensors.json")) as fo:
+        return json.load(fo)
+
+
+def __getattr__(name):
+    # SENSORS is loaded lazily, so that importing this module doesn't
+    # read and parse sensors.json
+    if name == "SENSORS":
+        return _sensors()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# satellite name prefix and number, eg 'Landsat-5', 'LANDSAT8'
+FIXNAME_PATTERN = re.compile(r"([a-zA-Z]+)[_-]?(\d)")
+
+# numeric band id, eg '1', '8A'
+BAND_ID_PATTERN = re.compile(r"[0-9].?")
+
+# 'B' and zero padding of an ESA band id, eg 'B01' -> '1', 'B8A' -> '8A'
+ESA_BAND_PREFIX_PATTERN = re.compile(r"B[0]?")
 
 
 def fixname(s):
@@ -65,19 +99,47 @@ def fixname(s):
     Performs 'Landsat7' to 'LANDSAT_7', 'LANDSAT8' to 'LANDSAT_8',
     'Landsat-5' to 'LANDSAT_5'.
     """
-    return re.sub(
-        r"([a-zA-Z]+)[_-]?(\d)", lambda m: m.group(1).upper() + "_" + m.group(2), s
-    )
+    # satellite names are a letter prefix, an optional separator and
+    # the satellite number, so a scan to the first digit is sufficient
+    for i, char in enumerate(s):
+        if char.isdigit():
+            prefix = s[:i]
+            if prefix[-1:] in ("_", "-"):
+                prefix = prefix[:-1]
+
+            if prefix.isalpha():
+                return f"{prefix.upper()}_{s[i:]}"
+
+            # anything else gets the general substitution
+            return FIXNAME_PATTERN.sub(
+                lambda m: m.group(1).upper() + "_" + m.group(2), s
+            )
+
+    return s
 
 
 def find_in(path, s, suffix="txt"):
     """Search through `path` and its children for the first occurance of a
     file with `s` in its name. Returns the path of the file or `None`.
     """
-    for root, _, files in os.walk(path):
-        for f in files:
-            if s in f and f.endswith(suffix):
-                return os.path.join(root, f)
+    # same top-down search order as os.walk, but the files of each
+    # directory are checked as they are read, and nothing more is listed
+    # once a match is found
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif s in entry.name and entry.name.endswith(suffix):
+                    return entry.path
+    except OSError:
+        return None
+
+    for subdir in subdirs:
+        found = find_in(subdir, s, suffix)
+        if found is not None:
+            return found
     return None
 
 
@@ -87,7 +149,7 @@ def preliminary_acquisitions_data(path, hint=None):
         data = preliminary_acquisitions_data_s2_sinergise(path)
         return [{"id": data["granule_id"], "datetime": data["acq_time"]}]
 
-    elif splitext(path)[1] == ".zip":
+    elif path.endswith(".zip"):
         archive = zipfile.ZipFile(path)
         xml_root = xml_via_safe(archive, path)
         granules = get_granules_via_safe(archive, xml_root)
@@ -104,7 +166,7 @@ def preliminary_acquisitions_data(path, hint=None):
             _, data = preliminary_acquisitions_data_via_mtl(path)
             return [
                 {
-                    "id": nested_lookup("landsat_scene_id", data)[0],
+                    "id": mtl_lookup(data, "landsat_scene_id"),
                     "datetime": get_acquisition_datetime_via_mtl(data),
                 }
             ]
@@ -134,7 +196,7 @@ def acquisitions(
     """
     if hint == "s2_sinergise":
         container = acquisitions_s2_sinergise(path)
-    elif splitext(path)[1] == ".zip":
+    elif path.endswith(".zip"):
         container = acquisitions_via_safe(path)
     else:
         try:
@@ -166,14 +228,15 @@ def create_resolution_groups(acqs: List[Acquisition]) -> ResolutionGroups:
          'RES-GROUP-1: [acquisition, acquisition],
          'RES-GROUP-N: [acquisition, acquisition]}
     """
-    fmt = "RES-GROUP-{}"
     # 0 -> n resolution sets (higest res to lowest res)
     resolutions = sorted({acq.resolution for acq in acqs})
-    res_groups = OrderedDict([(fmt.format(i), []) for i, _ in enumerate(resolutions)])
+    group_names = {res: RESG_FMT.format(i) for i, res in enumerate(resolutions)}
+    res_groups = OrderedDict([(name, []) for name in group_names.values()])
 
-    for acq in sorted(acqs):
-        group = fmt.format(resolutions.index(acq.resolution))
-        res_groups[group].append(acq)
+    # sort on each acquisition's sortkey directly, rather than calling it
+    # twice for every comparison via __lt__
+    for acq in sorted(acqs, key=methodcaller("sortkey")):
+        res_groups[group_names[acq.resolution]].append(acq)
 
     return res_groups
 
@@ -209,8 +272,8 @@ def get_acquisition_datetime_via_mtl(data: dict) -> datetime.datetime:
 
     prod_md = data[coll_map["PRODUCT_METADATA"]]
 
-    acq_date = prod_md.get("acquisition_date", prod_md["date_acquired"])
-    centre_time = prod_md.get("scene_center_scan_time", prod_md["scene_center_time"])
+    acq_date = mtl_value(prod_md, "acquisition_date", "date_acquired")
+    centre_time = mtl_value(prod_md, "scene_center_scan_time", "scene_center_time")
     acq_datetime = datetime.datetime.combine(acq_date, centre_time)
 
     return acq_datetime
@@ -266,7 +329,7 @@ def worldview2_acquisitions_via_xml(pathname: str) -> AcquisitionsContainer:
             band_name = band_tag.tag.replace("_", "-")
             band_id = str(WV2.band_names.index(band_name) + 1)
 
-            band_configurations = SENSORS[WV2.platform_id][WV2.sensor_id]["band_ids"]
+            band_configurations = _sensors()[WV2.platform_id][WV2.sensor_id]["band_ids"]
             metadata = {
                 key: value
                 for key, value in band_configurations.get(band_id, {}).items()
@@ -297,6 +360,30 @@ def get_collection_map(data_keys):
     return LANDSATMTLMAP[coll]
 
 
+def mtl_value(md: dict, *keys: str):
+    """Return the value of the first of `keys` found in the MTL group `md`,
+    for values that are named differently between MTL versions.
+    Only the last key is required to exist.
+    """
+    for key in keys[:-1]:
+        if key in md:
+            return md[key]
+
+    return md[keys[-1]]
+
+
+def mtl_lookup(data: dict, key: str):
+    """Return the value of `key` from the parsed MTL `data`.
+    The groups known to hold `key` are checked directly, and the whole
+    document is only searched when the layout is an unfamiliar one.
+    """
+    for group in MTL_LOOKUP_GROUPS.get(key, ()):
+        if key in data.get(group, {}):
+            return data[group][key]
+
+    return nested_lookup(key, data)[0]
+
+
 def acquisitions_via_mtl(pathname: str) -> AcquisitionsContainer:
     """Obtain a list of Acquisition objects from `pathname`.
     The argument `pathname` can be a MTL file or a directory name.
@@ -336,17 +423,17 @@ def acquisitions_via_mtl(pathname: str) -> AcquisitionsContainer:
         acqtype = LandsatAcquisition
 
     # solar angles
-    solar_azimuth = nested_lookup("sun_azimuth", data)[0]
-    solar_elevation = nested_lookup("sun_elevation", data)[0]
+    solar_azimuth = mtl_lookup(data, "sun_azimuth")
+    solar_elevation = mtl_lookup(data, "sun_elevation")
 
     # granule id
-    granule_id = nested_lookup("landsat_scene_id", data)[0]
+    granule_id = mtl_lookup(data, "landsat_scene_id")
 
     # bands to ignore
     ignore = ["band_quality"]
 
     # supported bands for the given platform & sensor id's
-    band_configurations = SENSORS[platform_id][sensor_id]["band_ids"]
+    band_configurations = _sensors()[platform_id][sensor_id]["band_ids"]
 
     acqs = []
     for band in bands_:
@@ -363,24 +450,20 @@ def acquisitions_via_mtl(pathname: str) -> AcquisitionsContainer:
         sensor_band_info = band_configurations.get(band_id, {})
 
         # band id name, band filename, band full file pathname
-        band_fname = cont_md.get(f"{band}_file_name", cont_md[f"file_name_{band}"])
+        band_fname = mtl_value(cont_md, f"{band}_file_name", f"file_name_{band}")
         fname = pjoin(prefix_name, band_fname)
 
-        min_rad = rad_md.get(f"lmin_{band}", rad_md[f"radiance_minimum_{band}"])
-        max_rad = rad_md.get(f"lmax_{band}", rad_md[f"radiance_maximum_{band}"])
+        min_rad = mtl_value(rad_md, f"lmin_{band}", f"radiance_minimum_{band}")
+        max_rad = mtl_value(rad_md, f"lmax_{band}", f"radiance_maximum_{band}")
 
-        min_quant = quant_md.get(
-            f"qcalmin_{band}", quant_md[f"quantize_cal_min_{band}"]
-        )
-        max_quant = quant_md.get(
-            f"qcalmax_{band}", quant_md[f"quantize_cal_max_{band}"]
-        )
+        min_quant = mtl_value(quant_md, f"qcalmin_{band}", f"quantize_cal_min_{band}")
+        max_quant = mtl_value(quant_md, f"qcalmax_{band}", f"quantize_cal_max_{band}")
 
         ref_add = rescaling_md.get(f"reflectance_add_{band}")
         ref_mult = rescaling_md.get(f"reflectance_mult_{band}")
 
         # metadata
-        attrs = dict(sensor_band_info.items())
+        attrs = dict(sensor_band_info)
         if attrs.get("supported_band"):
             attrs["solar_azimuth"] = solar_azimuth
             attrs["solar_elevation"] = solar_elevation
@@ -403,61 +486,89 @@ def acquisitions_via_mtl(pathname: str) -> AcquisitionsContainer:
     )
 
 
-def preliminary_acquisitions_data_s2_sinergise(pathname: str) -> dict:
-    """Preliminary data for Sinergise Sentinel-2."""
-    search_paths = {
-        "datastrip/metadata.xml": [
-            {
-                "key": "platform_id",
-                "search_path": ".//*/SPACECRAFT_NAME",
-                "parse": lambda x: fixname(x[0].text) if x else None,
-            },
-            {
-                "key": "processing_baseline",
-                "search_path": ".//*/PROCESSING_BASELINE",
-                "parse": lambda x: x[0].text if x else None,
-            },
-            {
-                "key": "u",
-                "search_path": ".//*/Reflectance_Conversion/U",
-                "parse": lambda x: float(x[0].text) if x else None,
-            },
-            {
-                "key": "qv",
-                "search_path": ".//*/QUANTIFICATION_VALUE",
-                "parse": lambda x: float(x[0].text) if x else None,
-            },
-            {
-                "key": "solar_irradiance_list",
-                "search_path": ".//*/SOLAR_IRRADIANCE",
-                "parse": lambda x: {
-                    s2_index_to_band_id(si.attrib["bandId"]): float(si.text) for si in x
-                },
-            },
-        ],
-        "metadata.xml": [
-            {
-                "key": "granule_id",
-                "search_path": ".//*/TILE_ID",
-                "parse": lambda x: x[0].text if x else None,
-            },
-            {
-                "key": "acq_time",
-                "search_path": ".//*/SENSING_TIME",
-                "parse": lambda x: parser.parse(x[0].text) if x else None,
+def find_xml_elements(source, paths):
+    """Collect the elements of the XML document `source` whose paths end
+    with each of the tag sequences in `paths`, in a single pass.
+    Matches the elements of `findall(".//*/" + "/".join(path))` for each
+    path (in document order), without a search of the tree for every path.
+    Returns a `dict` of the matching elements, keyed by path.
+    """
+    found = {path: [] for path in paths}
+    paths_by_tag = {}
+    for path in found:
+        paths_by_tag.setdefault(path[-1], []).append(path)
+
+    # matches are collected on the start event to keep the document order;
+    # the elements are complete once the whole document has been parsed
+    tags = []
+    for event, elem in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "end":
+            tags.pop()
+            continue
+
+        tags.append(elem.tag)
+        for path in paths_by_tag.get(elem.tag, ()):
+            # ".//*/" excludes the root and its immediate children
+            if len(tags) >= len(path) + 2 and tuple(tags[-len(path) :]) == path:
+                found[path].append(elem)
+
+    return found
+
+
+# the Sinergise S2 metadata values, as tag paths within each metadata file
+S2_SINERGISE_SEARCH_PATHS = {
+    "datastrip/metadata.xml": [
+        {
+            "key": "platform_id",
+            "path": ("SPACECRAFT_NAME",),
+            "parse": lambda x: fixname(x[0].text) if x else None,
+        },
+        {
+            "key": "processing_baseline",
+            "path": ("PROCESSING_BASELINE",),
+            "parse": lambda x: x[0].text if x else None,
+        },
+        {
+            "key": "u",
+            "path": ("Reflectance_Conversion", "U"),
+            "parse": lambda x: float(x[0].text) if x else None,
+        },
+        {
+            "key": "qv",
+            "path": ("QUANTIFICATION_VALUE",),
+            "parse": lambda x: float(x[0].text) if x else None,
+        },
+        {
+            "key": "solar_irradiance_list",
+            "path": ("SOLAR_IRRADIANCE",),
+            "parse": lambda x: {
+                s2_index_to_band_id(si.attrib["bandId"]): float(si.text) for si in x
             },
-        ],
-    }
+        },
+    ],
+    "metadata.xml": [
+        {
+            "key": "granule_id",
+            "path": ("TILE_ID",),
+            "parse": lambda x: x[0].text if x else None,
+        },
+        {
+            "key": "acq_time",
+            "path": ("SENSING_TIME",),
+            "parse": lambda x: parser.parse(x[0].text) if x else None,
+        },
+    ],
+}
 
+
+def preliminary_acquisitions_data_s2_sinergise(pathname: str) -> dict:
+    """Preliminary data for Sinergise Sentinel-2."""
     acquisition_data = {}
-    for fn, terms in search_paths.items():
-        xml_root = None
-        with open(pathname + "/" + fn, "rb") as fd:
-            xml_root = ElementTree.XML(fd.read())
+    for fn, terms in S2_SINERGISE_SEARCH_PATHS.items():
+        with open(f"{pathname}/{fn}", "rb") as fd:
+            elements = find_xml_elements(fd, [term["path"] for term in terms])
         for term in terms:
-            acquisition_data[term["key"]] = term["parse"](
-                xml_root.findall(term["search_path"])
-            )
+            acquisition_data[term["key"]] = term["parse"](elements[term["path"]])
 
     return acquisition_data
 
@@ -472,11 +583,11 @@ def acquisitions_s2_sinergise(pathname: str) -> AcquisitionsContainer:
     with additional information retrieved from the productInfo.json
     sitting in a subfolder
     """
-    granule_xml = pathname + "/metadata.xml"
+    granule_xml = f"{pathname}/metadata.xml"
 
     acquisition_data = preliminary_acquisitions_data_s2_sinergise(pathname)
 
-    band_configurations = SENSORS[acquisition_data["platform_id"]]["MSI"]["band_ids"]
+    band_configurations = _sensors()[acquisition_data["platform_id"]]["MSI"]["band_ids"]
     esa_ids = [
         "B01",
         "B02",
@@ -499,21 +610,26 @@ def acquisitions_s2_sinergise(pathname: str) -> AcquisitionsContainer:
         # assume it is S2B
         acqtype = Sentinel2bSinergiseAcquisition
 
+    # the band images available in the granule directory, listed once
+    # rather than checked for each configured band
+    with os.scandir(pathname) as entries:
+        images = {entry.name for entry in entries if entry.is_file()}
+
     acqs = []
     for band_id in band_configurations:
         # If it is a configured B-format transform it to the correct format
-        if re.match("[0-9].?", band_id):
+        if BAND_ID_PATTERN.match(band_id):
             band_name = f"B{band_id.zfill(2)}"
 
-        img_fname = pathname + "/" + band_name + ".jp2"
+        img_fname = f"{pathname}/{band_name}.jp2"
 
-        if not os.path.isfile(img_fname):
+        if f"{band_name}.jp2" not in images:
             continue
 
         if band_name not in esa_ids:
             continue
 
-        attrs = dict(band_configurations[band_id].items())
+        attrs = dict(band_configurations[band_id])
         if attrs.get("supported_band"):
             attrs["solar_irradiance"] = acquisition_data["solar_irradiance_list"][
                 band_id
@@ -545,15 +661,17 @@ def xml_via_safe(archive: zipfile.ZipFile, pathname: str) -> ElementTree.XML:
 
     Returns an `ElementTree.XML` object.
     """
-    xmlfiles = [s for s in archive.namelist() if "MTD_MSIL1C.xml" in s]
+    namelist = archive.namelist()
+    xmlfiles = [s for s in namelist if "MTD_MSIL1C.xml" in s]
 
     if not xmlfiles:
         pattern = basename(pathname.replace("PRD_MSIL1C", "MTD_SAFL1C"))
         pattern = pattern.replace(".zip", ".xml")
-        xmlfiles = [s for s in archive.namelist() if pattern in s]
+        xmlfiles = [s for s in namelist if pattern in s]
 
-    mtd_xml = archive.read(xmlfiles[0])
-    xml_root = ElementTree.XML(mtd_xml)
+    # parse straight from the archive member
+    with archive.open(xmlfiles[0]) as fd:
+        xml_root = ElementTree.parse(fd).getroot()
 
     return xml_root
 
@@ -581,19 +699,25 @@ def get_granules_via_safe(archive, xml_root):
 
         return [imid.text for imid in granule.findall(search_term)]
 
+    # the granule metadata candidates are filtered from the archive listing
+    # once, rather than for every granule
+    xml_names = [s for s in archive.namelist() if ".xml" in s]
+    tile_xmls = [s for s in xml_names if "MTD_TL.xml" in s]
+
     def granule_xml_path(granule):
-        granule_xmls = [s for s in archive.namelist() if "MTD_TL.xml" in s]
+        granule_xmls = tile_xmls
 
         if not granule_xmls:
             pattern = granule_id(granule).replace("MSI", "MTD")
-            pattern = pattern.replace("".join(["_N", processing_baseline]), ".xml")
+            pattern = pattern.replace(f"_N{processing_baseline}", ".xml")
 
-            granule_xmls = [s for s in archive.namelist() if pattern in s]
+            granule_xmls = [s for s in xml_names if pattern in s]
 
         return granule_xmls[0]
 
     def granule_root(xml_path):
-        return ElementTree.XML(archive.read(xml_path))
+        with archive.open(xml_path) as fd:
+            return ElementTree.parse(fd).getroot()
 
     def granule_data(granule):
         xml_path = granule_xml_path(granule)
@@ -621,13 +745,17 @@ def acquisitions_via_safe(pathname: str) -> AcquisitionsContainer:
     Returns an instance of `AcquisitionsContainer`.
     """
 
-    def band_id_helper(fname, esa_ids):
+    def band_id_helper(fname, band_ids):
         """A helper function to find the band_id."""
         # TODO: do we need this func any more as res groups are now
         # derived rather pre-determined
-        for esa_id in esa_ids:
+        # image names end with the ESA id, eg '..._B8A.jp2'
+        esa_id = splitext(basename(fname))[0].rpartition("_")[2]
+        if esa_id in band_ids:
+            return band_ids[esa_id]
+
+        for esa_id, band_id in band_ids.items():
             if esa_id in fname:
-                band_id = re.sub(r"B[0]?", "", esa_id)
                 return band_id
         return None
 
@@ -643,9 +771,11 @@ def acquisitions_via_safe(pathname: str) -> AcquisitionsContainer:
     platform_id = fixname(xml_root.findall(search_term)[0].text)
 
     # supported bands for this sensor
-    band_configurations = SENSORS[platform_id]["MSI"]["band_ids"]
+    band_configurations = _sensors()[platform_id]["MSI"]["band_ids"]
 
-    if basename(pathname)[0:3] == "S2A":
+    # the platform is already known from the product metadata, so there's
+    # no need to inspect the archive name
+    if platform_id == "SENTINEL_2A":
         acqtype = Sentinel2aAcquisition
     else:
         # assume it is S2B
@@ -684,6 +814,7 @@ def acquisitions_via_safe(pathname: str) -> AcquisitionsContainer:
         "B12",
         "TCI",
     ]
+    band_ids = {esa_id: ESA_BAND_PREFIX_PATTERN.sub("", esa_id) for esa_id in esa_ids}
 
     # ESA L1C upgrade introducing scaling/offset
     search_term = (
@@ -691,10 +822,14 @@ def acquisitions_via_safe(pathname: str) -> AcquisitionsContainer:
     )
 
     offsets = {
-        re.sub(r"B[0]?", "", esa_ids[int(x.attrib["band_id"])]): int(x.text)
+        band_ids[esa_ids[int(x.attrib["band_id"])]]: int(x.text)
         for x in xml_root.findall(search_term)
     }
 
+    # the common root of the archive members, which is the same for
+    # every granule
+    image_path = find_image_path(archive.namelist())
+
     granule_groups = {}
     for granule_id, granule_data in granules.items():
         images = granule_data["images"]
@@ -704,14 +839,10 @@ def acquisitions_via_safe(pathname: str) -> AcquisitionsContainer:
         # handling different metadata versions for image paths
         # files retrieved from archive.namelist are not prepended with a '/'
         # Rasterio 1.0b1 requires archive paths start with a /
-        img_data_path = "".join(
-            ["zip://", pathname, "!/", find_image_path(archive.namelist())]
-        )
+        img_data_path = f"zip://{pathname}!/{image_path}"
 
         if basename(images[0]) == images[0]:
-            img_data_path = "".join(
-                [img_data_path, pjoin("GRANULE", granule_id, "IMG_DATA")]
-            )
+            img_data_path += pjoin("GRANULE", granule_id, "IMG_DATA")
 
         # acquisition centre datetime
         acq_time = acquisition_time_via_safe(granule_root)
@@ -719,14 +850,14 @@ def acquisitions_via_safe(pathname: str) -> AcquisitionsContainer:
         acqs = []
         for image in images:
             # image filename
-            img_fname = "".join([pjoin(img_data_path, image), ".jp2"])
+            img_fname = f"{pjoin(img_data_path, image)}.jp2"
 
             # band id
-            band_id = band_id_helper(img_fname, esa_ids)
+            band_id = band_id_helper(img_fname, band_ids)
 
             # band info stored in sensors.json
             sensor_band_info = band_configurations.get(band_id)
-            attrs = dict(sensor_band_info.items())
+            attrs = dict(sensor_band_info)
 
             # image attributes/metadata
             if sensor_band_info.get("supported_band"):
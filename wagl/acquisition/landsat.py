@@ -3,7 +3,6 @@
 import gzip
 import math
 import tarfile
-import tempfile
 from pathlib import Path
 
 import numpy as np
@@ -177,8 +176,9 @@ class Landsat7Acquisition(LandsatAcquisition):
         """Extract the gap mask from within the tar.
         The gap mask is a TIF that is then pushed through gzip,
         horrible, and in order to read it, we need to unpack from
-        the tar, decompress using gzip, then write to disk so GDAL
-        can read it.
+        the tar and decompress using gzip. The decompressed TIF is
+        handed to GDAL as an in-memory file rather than being written
+        to disk.
         """
         # mask files are contained in a sub-directory named 'gap-mask'
         path = Path(self.uri.replace("!", "")[6:])
@@ -197,17 +197,12 @@ class Landsat7Acquisition(LandsatAcquisition):
         with tarfile.open(str(path.parent)) as tf:
             mem = tf.getmember(str(mask_name))
             fobj = tf.extractfile(mem)
-            with gzip.open(fobj) as gz:
-                with tempfile.TemporaryDirectory(suffix=".gap-mask") as tmpd:
-                    out_fname = Path(tmpd, "gap-mask.tif")
-                    with open(out_fname, "wb") as src:
-                        src.write(gz.read())
+            with gzip.open(fobj) as gz, rasterio.MemoryFile(gz.read()) as memfile:
+                # read gap mask into memory
+                with memfile.open() as src:
+                    data = src.read(1)
 
-                    # read gap mask into memory
-                    with rasterio.open(out_fname) as src:
-                        data = src.read(1)
-
-                    self._gap_mask = data == 0
+                self._gap_mask = data == 0
 
     def radiance_data(self, window=None, out_no_data=-999, esun=None):
         """This method overwrites the parent's method to handle a special
@@ -77,6 +77,8 @@ class Sentinel2Acquisition(Acquisition):
         """Return `numpy.array` of the data for this acquisition.
         If `out` is supplied, it must be a numpy.array into which
         the Acquisition's data will be read.
+        If `window` is supplied (as ((row_start, row_stop), (col_start,
+        col_stop))), only that region is read and decoded.
         """
         result = super().data(out=out, window=window, masked=masked)
 
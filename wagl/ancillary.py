@@ -6,15 +6,16 @@ import configparser
 import datetime
 import json
 import os.path
+from functools import lru_cache
 from os.path import join as pjoin
 from posixpath import join as ppjoin
 from typing import Dict, List, Optional, Set, Tuple, TypedDict
 
 import attr
 import h5py
+import numexpr
 import numpy as np
-import pandas as pd
-from geopandas import GeoSeries
+import shapely
 from shapely import wkt
 from shapely.geometry import Point, Polygon
 
@@ -32,13 +33,15 @@ from wagl.constants import (
     OzoneTier,
     WaterVapourTier,
 )
-from wagl.data import get_pixel, get_pixel_from_raster
+from wagl.data import get_pixel, get_pixel_from_raster, read_pixel
 from wagl.hdf5 import (
     VLEN_STRING,
     H5CompressionFilter,
     attach_table_attributes,
+    dataframe_table_attributes,
     read_h5_table,
     write_dataframe,
+    write_h5_table,
     write_scalar,
 )
 from wagl.metadata import current_h5_metadata, is_offshore_territory
@@ -118,6 +121,17 @@ def relative_humdity(surface_temp, dewpoint_temp, kelvin=True):
     """Calculates relative humidity given a surface temperature and
     dewpoint temperature.
     """
+    if np.ndim(surface_temp) or np.ndim(dewpoint_temp):
+        # evaluate arrays (including the conversion to Celcius) in a single
+        # pass, rather than via temporaries
+        offset = 273.15 if kelvin else 0.0
+        expr = (
+            "100 * ((112.0 - 0.1 * (surf_t - offset) + (dew_t - offset))"
+            " / (112.0 + 0.9 * (surf_t - offset))) ** 8"
+        )
+        local_dict = {"surf_t": surface_temp, "dew_t": dewpoint_temp, "offset": offset}
+        return numexpr.evaluate(expr, local_dict=local_dict)
+
     if kelvin:
         surf_t = kelvin_2_celcius(surface_temp)
         dew_t = kelvin_2_celcius(dewpoint_temp)
@@ -130,19 +144,20 @@ def relative_humdity(surface_temp, dewpoint_temp, kelvin=True):
     return rh
 
 
-def check_interpolation_sample_geometry(container, group, grp_name):
+def check_interpolation_sample_geometry(container, coordinator, grp_name):
+    """Whether the `coordinator` sample locations map to distinct pixels
+    of the resolution group `grp_name`.
+    """
     acqs = container.get_acquisitions(group=grp_name)
     acq = acqs[0]
     geobox = acq.gridded_geo_box()
-    coord_read = read_h5_table(group, DatasetName.COORDINATOR.value)
-    coord = np.zeros((coord_read.shape[0], 2), dtype="int")
-    map_x = coord_read.map_x.values
-    map_y = coord_read.map_y.values
+    coord = np.zeros((coordinator.shape[0], 2), dtype="int")
+    map_x = coordinator["map_x"]
+    map_y = coordinator["map_y"]
     coord[:, 1], coord[:, 0] = (map_x, map_y) * ~geobox.transform
 
-    unique_coords = {(coord[i, 0], coord[i, 1]) for i in range(coord.shape[0])}
-
-    return coord.shape[0] == len(unique_coords)
+    # the sample locations must all map to distinct pixels
+    return coord.shape[0] == np.unique(coord, axis=0).shape[0]
 
 
 def default_interpolation_grid(acquisition, vertices, boxline_dataset):
@@ -152,13 +167,13 @@ def default_interpolation_grid(acquisition, vertices, boxline_dataset):
     iend = boxline_dataset["end_index"]
     nvertices = vertices[0] * vertices[1]
     locations = np.empty((vertices[0], vertices[1], 2), dtype="int64")
-    grid_rows = list(
-        np.linspace(0, rows - 1, vertices[0], endpoint=True, dtype="int32")
+    # row indices for sample-grid & raster
+    grid_rows = np.linspace(0, rows - 1, vertices[0], endpoint=True, dtype="int32")
+    locations[:, :, 0] = grid_rows[:, np.newaxis]
+    # all grid lines at once; one line per row, truncated to the column index
+    locations[:, :, 1] = np.linspace(
+        istart[grid_rows], iend[grid_rows], vertices[1], endpoint=True, axis=1
     )
-    for ig, ir in enumerate(grid_rows):  # row indices for sample-grid & raster
-        grid_line = np.linspace(istart[ir], iend[ir], vertices[1], endpoint=True)
-        locations[ig, :, 0] = ir
-        locations[ig, :, 1] = grid_line
     locations = locations.reshape(nvertices, 2)
     coordinator = create_coordinator(locations, geobox)
     return coordinator
@@ -281,21 +296,23 @@ def collect_ancillary(
 
     boxline_dataset = satellite_solar_group[DatasetName.BOXLINE.value][:]
     coordinator = create_vertices(acquisition, boxline_dataset, vertices)
-    lonlats = zip(coordinator["longitude"], coordinator["latitude"])
+    lonlats = np.column_stack((coordinator["longitude"], coordinator["latitude"]))
 
     desc = (
         "Contains the row and column array coordinates used for the "
         "atmospheric calculations."
     )
     attrs = {"description": desc, "array_coordinate_offset": 0}
-    kwargs = compression.settings(filter_opts)
+    # a table of only `vertices` rows; stored contiguously as chunking and
+    # filtering it would cost more than it saves
     dset_name = DatasetName.COORDINATOR.value
-    coord_dset = group.create_dataset(dset_name, data=coordinator, **kwargs)
+    coord_dset = group.create_dataset(dset_name, data=coordinator)
     attach_table_attributes(coord_dset, title="Coordinator", attrs=attrs)
 
-    # check if modtran interpolation points coincide
+    # check if modtran interpolation points coincide; the table in memory
+    # is checked, rather than reading it back for each group
     if not all(
-        check_interpolation_sample_geometry(container, group, grp_name)
+        check_interpolation_sample_geometry(container, coordinator, grp_name)
         for grp_name in container.supported_groups
     ):
         coord_dset[:] = default_interpolation_grid(
@@ -338,7 +355,8 @@ def collect_sbt_ancillary(
         An instance of an `Acquisition` object.
 
     :param lonlats:
-        A `list` of tuples containing (longitude, latitude) coordinates.
+        A `NumPy` array of shape (N, 2), or a sequence of 2-tuples,
+        containing (longitude, latitude) coordinates.
 
     :param ancillary_path:
         A `str` containing the directory pathname to the ECMWF
@@ -428,42 +446,65 @@ def collect_sbt_ancillary(
 
         # combine the surface and higher pressure layers into a single array
         cols = ["GeoPotential_Height", "Pressure", "Temperature", "Relative_Humidity"]
-        layers = pd.DataFrame(
-            columns=cols, index=range(rh[0].shape[0]), dtype="float64"
-        )
-
-        layers["GeoPotential_Height"] = gph[0]["GeoPotential_Height"].values
-        layers["Pressure"] = ECWMF_LEVELS[::-1]
-        layers["Temperature"] = tmp[0]["Temperature"].values
-        layers["Relative_Humidity"] = rh[0]["Relative_Humidity"].values
-
-        # define the surface level
-        df = pd.DataFrame(
-            {
-                "GeoPotential_Height": sfc_hgt[0],
-                "Pressure": sfc_prs[0],
-                "Temperature": kelvin_2_celcius(t2m[0]),
-                "Relative_Humidity": sfc_rh,
-            },
-            index=[0],
-        )
+        gph_height = gph[0]["GeoPotential_Height"].to_numpy()
+        temperature = tmp[0]["Temperature"].to_numpy()
+        humidity = rh[0]["Relative_Humidity"].to_numpy()
+        pressure = np.asarray(ECWMF_LEVELS[::-1], dtype="float64")
 
         # MODTRAN requires the height to be ascending
-        # and the pressure to be descending
-        wh = (layers["GeoPotential_Height"] > sfc_hgt[0]) & (
-            layers["Pressure"] < sfc_prs[0].round()
+        # and the pressure to be descending.
+        # The levels are ordered from the ground up, so the levels above
+        # the surface (both in height and pressure) are a trailing slice
+        levels_below = max(
+            np.searchsorted(gph_height, sfc_hgt[0], side="right"),
+            len(ECWMF_LEVELS)
+            - np.searchsorted(ECWMF_LEVELS, sfc_prs[0].round(), side="left"),
+        )
+        above = slice(levels_below, None)
+
+        # the surface level, followed by the pressure levels above it.
+        # The table is laid out as write_dataframe would store a DataFrame
+        # (the index field first), so that it can be written in one go
+        # and still be read back as a DataFrame
+        profile = np.empty(
+            len(ECWMF_LEVELS) - levels_below + 1,
+            dtype=[("index", "int64")] + [(col, "float64") for col in cols],
+        )
+        profile["index"] = np.arange(profile.shape[0])
+        profile[0] = (0, sfc_hgt[0], sfc_prs[0], kelvin_2_celcius(t2m[0]), sfc_rh)
+        profile["GeoPotential_Height"][1:] = gph_height[above]
+        profile["Pressure"][1:] = pressure[above]
+        profile["Temperature"][1:] = temperature[above]
+        profile["Relative_Humidity"][1:] = humidity[above]
+
+        profile_attrs = dataframe_table_attributes(
+            profile.dtype, ["index"], profile.shape[0], attrs
         )
-        df = df.append(layers[wh])
-        df.reset_index(drop=True, inplace=True)
 
         dname = ppjoin(pnt, DatasetName.ATMOSPHERIC_PROFILE.value)
-        write_dataframe(
-            df, dname, fid, compression, attrs=attrs, filter_opts=filter_opts
+        write_h5_table(
+            profile,
+            dname,
+            fid,
+            compression,
+            attrs=profile_attrs,
+            filter_opts=filter_opts,
         )
 
         fid[pnt].attrs["lonlat"] = lonlat
 
 
+@lru_cache(maxsize=8)
+def _read_luigi_config(path: str, _mtime: Optional[float]):
+    """Parse the luigi config at `path`, cached against its modification
+    time, as long running workers load the same config repeatedly.
+    The parser is shared between calls, so it must only be read from.
+    """
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
 @attr.define
 class AncillaryConfig:
     """
@@ -503,8 +544,13 @@ class AncillaryConfig:
                     "No luigi config path given, and no default config found"
                 )
 
-        config = configparser.ConfigParser()
-        config.read(luigi_config_path)
+        # a missing file reads as an empty config, as with configparser
+        mtime = (
+            os.path.getmtime(luigi_config_path)
+            if os.path.exists(luigi_config_path)
+            else None
+        )
+        config = _read_luigi_config(luigi_config_path, mtime)
 
         def get_dict(field):
             try:
@@ -633,17 +679,20 @@ def collect_nbar_ancillary(
     aerosol = get_aerosol_data(acquisition, aerosol_dict)
     write_scalar(aerosol[0], DatasetName.AEROSOL.value, fid, aerosol[1])
 
-    wv = get_water_vapour(acquisition, water_vapour_dict)
+    # centre_lonlat reprojects on every access; the readers share it
+    lonlat = geobox.centre_lonlat
+
+    wv = get_water_vapour(acquisition, water_vapour_dict, lonlat=lonlat)
     write_scalar(wv[0], DatasetName.WATER_VAPOUR.value, fid, wv[1])
 
-    ozone = get_ozone_data(ozone_path, geobox.centre_lonlat, dt)
+    ozone = get_ozone_data(ozone_path, lonlat, dt)
     write_scalar(ozone[0], DatasetName.OZONE.value, fid, ozone[1])
 
     if offshore:
         dsm_path = cop_pathname
     else:
         dsm_path = dem_path
-    elev = get_elevation_data(geobox.centre_lonlat, dsm_path, offshore)
+    elev = get_elevation_data(lonlat, dsm_path, offshore)
     write_scalar(elev[0], DatasetName.ELEVATION.value, fid, elev[1])
 
     # brdf
@@ -678,6 +727,8 @@ def get_aerosol_data(
     roi_poly = Polygon(
         [geobox.ul_lonlat, geobox.ur_lonlat, geobox.lr_lonlat, geobox.ll_lonlat]
     )
+    # the roi is tested against the extents of each candidate table
+    shapely.prepare(roi_poly)
 
     descr = ["AATSR_PIX", "AATSR_CMP_YEAR_MONTH", "AATSR_CMP_MONTH"]
     names = ["ATSR_LF_%Y%m", "aot_mean_%b_%Y_All_Aerosols", "aot_mean_%b_All_Aerosols"]
@@ -698,10 +749,12 @@ def get_aerosol_data(
         for pathname, description in zip(pathnames, descr):
             tier = AerosolTier[description]
             if pathname in fid:
-                df = read_h5_table(fid, pathname)
                 aerosol_poly = wkt.loads(fid[pathname].attrs["extents"])
 
-                if aerosol_poly.intersects(roi_poly):
+                # only read the table once it is known to cover the roi
+                if roi_poly.intersects(aerosol_poly):
+                    df = read_h5_table(fid, pathname)
+
                     if description == "AATSR_PIX":
                         abs_diff = (df["timestamp"] - dt).abs()
                         df = df[abs_diff < delta_tolerance]
@@ -711,8 +764,9 @@ def get_aerosol_data(
                         continue
 
                     intersection = aerosol_poly.intersection(roi_poly)
-                    pts = GeoSeries([Point(x, y) for x, y in zip(df["lon"], df["lat"])])
-                    idx = pts.within(intersection)
+                    idx = shapely.contains_xy(
+                        intersection, df["lon"].to_numpy(), df["lat"].to_numpy()
+                    )
                     data = df[idx]["aerosol"].mean()
 
                     if np.isfinite(data):
@@ -800,9 +854,12 @@ def get_water_vapour(
     water_vapour_dict: WaterVapourDict,
     scale_factor=0.1,
     tolerance=1,
+    lonlat: Optional[LonLat] = None,
 ):
     """Retrieve the water vapour value for an `acquisition` and the
     path for the water vapour ancillary data.
+
+    `lonlat` defaults to the centre of the acquisition's geobox.
     """
     datafile = find_water_vapour_definitive_path(acquisition, water_vapour_dict)
 
@@ -813,22 +870,44 @@ def get_water_vapour(
         metadata = {"id": np.array([], VLEN_STRING), "tier": WaterVapourTier.USER.name}
         return water_vapour_dict["user"], metadata
 
-    geobox = acquisition.gridded_geo_box()
+    if lonlat is None:
+        lonlat = acquisition.gridded_geo_box().centre_lonlat
 
+    def read_water_vapour(fid, dataset_name):
+        if isinstance(dataset_name, bytes):
+            dataset_name = dataset_name.decode("utf-8")
+
+        try:
+            return read_pixel(fid, dataset_name, lonlat)
+        except ValueError:
+            # h5py raises a ValueError not an IndexError for out of bounds
+            raise AncillaryError("No Water Vapour data")
+
+    data = None
     if os.path.isfile(datafile):
+        # the index and the observation are read from the one open file
         with h5py.File(datafile, "r") as fid:
             index = read_h5_table(fid, "INDEX")
 
-        # set the tolerance in days to search back in time
-        max_tolerance = -datetime.timedelta(days=tolerance)
-
-        # only look for observations that have occured in the past
-        time_delta = index.timestamp - dt
-        result = time_delta[
-            (time_delta < datetime.timedelta()) & (time_delta > max_tolerance)
-        ]
-
-    if not os.path.isfile(datafile) or result.shape[0] == 0:
+            # set the tolerance in days to search back in time
+            max_tolerance = -datetime.timedelta(days=tolerance)
+
+            # only look for observations that have occured in the past
+            time_delta = index.timestamp - dt
+            result = time_delta[
+                (time_delta < datetime.timedelta()) & (time_delta > max_tolerance)
+            ]
+
+            if result.shape[0] != 0:
+                tier = WaterVapourTier.DEFINITIVE
+                # get the index of the closest water vapour observation
+                # which would be the maximum timedelta
+                # as we're only dealing with negative timedelta's here
+                idx = result.idxmax()
+                record = index.iloc[idx]
+                data, md_uuid = read_water_vapour(fid, record.dataset_name)
+
+    if data is None:
         if "fallback_dataset" not in water_vapour_dict:
             raise AncillaryError("No actual or fallback water vapour data.")
 
@@ -841,24 +920,8 @@ def get_water_vapour(
         observations = np.array([0, 6, 12, 18])
         hr = observations[np.argmin(np.abs(hour - observations))]
         dataset_name = f"AVERAGE/{month}/{hr:02d}00"
-        datafile = water_vapour_dict["fallback_dataset"]
-    else:
-        tier = WaterVapourTier.DEFINITIVE
-        # get the index of the closest water vapour observation
-        # which would be the maximum timedelta
-        # as we're only dealing with negative timedelta's here
-        idx = result.idxmax()
-        record = index.iloc[idx]
-        dataset_name = record.dataset_name
-
-    if isinstance(dataset_name, bytes):
-        dataset_name = dataset_name.decode("utf-8")
-
-    try:
-        data, md_uuid = get_pixel(datafile, dataset_name, geobox.centre_lonlat)
-    except ValueError:
-        # h5py raises a ValueError not an IndexError for out of bounds
-        raise AncillaryError("No Water Vapour data")
+        with h5py.File(water_vapour_dict["fallback_dataset"], "r") as fid:
+            data, md_uuid = read_water_vapour(fid, dataset_name)
 
     # the metadata from the original file says (Kg/m^2)
     # so multiply by 0.1 to get (g/cm^2)
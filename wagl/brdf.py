@@ -22,6 +22,7 @@ estimates is required.
 import datetime
 import logging
 import os
+from functools import lru_cache
 from os.path import join as pjoin
 from typing import Dict, List, Literal, Optional, Tuple, TypedDict
 
@@ -123,6 +124,42 @@ def _date_proximity(cmp_date, date_interpreter=lambda x: x):
     return _proximity_comparator
 
 
+def _parse_dir_date(dname: str, pattern: str) -> datetime.date:
+    """`strptime(dname, pattern).date()`, with the default 'YYYY.MM.DD'
+    names sliced directly; strptime is comparatively slow, and runs
+    once per directory.
+    """
+    if (
+        pattern == "%Y.%m.%d"
+        and len(dname) == 10
+        and dname[4] == dname[7] == "."
+        and (dname[:4] + dname[5:7] + dname[8:]).isdigit()
+    ):
+        return datetime.date(int(dname[:4]), int(dname[5:7]), int(dname[8:]))
+
+    return datetime.datetime.strptime(dname, pattern).date()
+
+
+@lru_cache(maxsize=8)
+def _brdf_dir_dates(
+    brdf_root_dir: str, pattern: str, _mtime: float
+) -> Tuple[datetime.date, ...]:
+    """The dates of the day directories in `brdf_root_dir`.
+    A root holds thousands of day directories and is searched for each
+    band and for each day looked back, so the parsed listing is cached
+    against the root's modification time (adding a day directory
+    changes it).
+    """
+    dirs = []
+    for dname in sorted(os.listdir(brdf_root_dir)):
+        try:
+            dirs.append(_parse_dir_date(dname, pattern))
+        except ValueError:
+            pass  # Ignore directories that don't match specified pattern
+
+    return tuple(dirs)
+
+
 def get_brdf_dirs_viirs(brdf_root: str, scene_date: datetime.date, pattern="%Y.%m.%d"):
     # our VIIRS collection follows the same folder structure as our MODIS collection
     return get_brdf_dirs_modis(brdf_root, scene_date, pattern=pattern)
@@ -144,12 +181,7 @@ def get_brdf_dirs_modis(
        A string containing the closest matching BRDF directory name inside the brdf root..
 
     """
-    dirs = []
-    for dname in sorted(os.listdir(brdf_root_dir)):
-        try:
-            dirs.append(datetime.datetime.strptime(dname, pattern).date())
-        except ValueError:
-            pass  # Ignore directories that don't match specified pattern
+    dirs = _brdf_dir_dates(brdf_root_dir, pattern, os.path.getmtime(brdf_root_dir))
 
     if not dirs:
         raise IndexError(f"No dirs found for {scene_date} in {brdf_root_dir}")
@@ -409,6 +441,19 @@ def VIIRS_crs():
     return prj
 
 
+@lru_cache(maxsize=16)
+def _read_ocean_mask(mask_pathname: str, bounds: Tuple) -> np.ndarray:
+    """Read the land (True) / ocean (False) mask within `bounds`, the
+    (ul, ur, lr, ll) map co-ordinates of a BRDF tile.
+    Every band and BRDF dataset of an acquisition visits the same tiles,
+    so the subsets are cached; the returned array is read-only.
+    """
+    ocean_mask, _ = read_subset(mask_pathname, *bounds)
+    ocean_mask = ocean_mask.astype(bool)
+    ocean_mask.flags.writeable = False
+    return ocean_mask
+
+
 def load_brdf_tile(
     src_poly,
     src_crs,
@@ -465,9 +510,8 @@ def load_brdf_tile(
 
     # read ocean mask file for correspoing tile window
     # land=1, ocean=0
-    bound_poly_coords = list(bound_poly.exterior.coords)[:4]
-    ocean_mask, _ = read_subset(fid_mask, *bound_poly_coords)
-    ocean_mask = ocean_mask.astype(bool)
+    bound_poly_coords = tuple(bound_poly.exterior.coords)[:4]
+    ocean_mask = _read_ocean_mask(fid_mask.name, bound_poly_coords)
 
     # inside=1, outside=0
     roi_mask = rasterize(
@@ -29,23 +29,30 @@ def get_pixel(h5_path: str, dataset_name: str, lonlat: Tuple[float, float]):
     by the tuple `lonlat`. Optionally, the `band` can be specified.
     """
     with h5py.File(h5_path, "r") as fid:
-        ds = fid[dataset_name]
-        geobox = GriddedGeoBox.from_h5_dataset(ds)
-        x, y = (int(v) for v in ~geobox.transform * lonlat)
+        return read_pixel(fid, dataset_name, lonlat)
 
-        # TODO; read metadata yaml for uuid
 
-        if ds.ndim == 3:
-            data = ds[:, y, x]
-        elif ds.ndim == 2:
-            data = ds[y, x]
-        else:
-            raise NotImplementedError("Only 2 and 3 dimensional data is supported")
-        # else: TODO; cater for the 4D data we pulled from ECMWF
-        # for 4D [day, level, y, x] we need another input param `day`
-        # data = ds[day, :, y, x]
+def read_pixel(fid, dataset_name: str, lonlat: Tuple[float, float]):
+    """As `get_pixel`, but for an already opened h5py `File`, so that
+    callers reading other content from the same file only open it once.
+    """
+    ds = fid[dataset_name]
+    geobox = GriddedGeoBox.from_h5_dataset(ds)
+    x, y = (int(v) for v in ~geobox.transform * lonlat)
+
+    # TODO; read metadata yaml for uuid
+
+    if ds.ndim == 3:
+        data = ds[:, y, x]
+    elif ds.ndim == 2:
+        data = ds[y, x]
+    else:
+        raise NotImplementedError("Only 2 and 3 dimensional data is supported")
+    # else: TODO; cater for the 4D data we pulled from ECMWF
+    # for 4D [day, level, y, x] we need another input param `day`
+    # data = ds[day, :, y, x]
 
-        metadata = current_h5_metadata(fid, dataset_path=dataset_name)
+    metadata = current_h5_metadata(fid, dataset_path=dataset_name)
 
     return data, metadata["id"]
 
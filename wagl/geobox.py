@@ -1,6 +1,8 @@
 """Gridded Data."""
 
 import math
+import threading
+from functools import lru_cache, wraps
 from math import radians
 
 import affine
@@ -26,6 +28,61 @@ affine.EPSILON2 = 1e-18
 CRS = "EPSG:4326"
 
 
+def _per_thread_cache(maxsize):
+    """As `functools.lru_cache`, but with a separate cache for each
+    thread; OSR objects aren't thread-safe, so must not be shared.
+    """
+
+    def decorator(func):
+        local = threading.local()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cached = getattr(local, "cached", None)
+            if cached is None:
+                cached = local.cached = lru_cache(maxsize=maxsize)(func)
+            return cached(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@_per_thread_cache(maxsize=None)
+def spatial_reference(crs=CRS):
+    """Return a (cached) osr.SpatialReference for the user input
+    string `crs` (eg "EPSG:4326"), using the traditional x, y axis
+    ordering.
+    The instance is shared between callers in the same thread, so
+    should be treated as read-only.
+    """
+    sr = osr.SpatialReference()
+    if sr.SetFromUserInput(crs) != 0:
+        raise ValueError(f"Invalid crs: {crs}")
+
+    sr.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+
+    return sr
+
+
+@_per_thread_cache(maxsize=32)
+def _coordinate_transformation(src_wkt, dst_wkt):
+    """Return a (cached) transformation between two CRS's, given as
+    WKT strings, using the traditional x, y axis ordering.
+    Creating a transformation requires a comparatively expensive PROJ
+    setup, so reuse them across calls within the same thread.
+    """
+    src_crs = osr.SpatialReference()
+    src_crs.ImportFromWkt(src_wkt)
+    src_crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+
+    dst_crs = osr.SpatialReference()
+    dst_crs.ImportFromWkt(dst_wkt)
+    dst_crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+
+    return osr.CoordinateTransformation(src_crs, dst_crs)
+
+
 class GriddedGeoBox:
     """Represents a north up rectangular region on the Earth's surface which
     has been divided into equal size retangular pixels for the purpose of
@@ -205,14 +262,19 @@ class GriddedGeoBox:
         self.shape = tuple([int(v) for v in shape])
         self.origin = origin
         if isinstance(crs, osr.SpatialReference):
+            # the given reference may be shared (eg by spatial_reference),
+            # so x,y axis ordering is enforced on a copy, if at all
+            if crs.GetAxisMappingStrategy() != osr.OAMS_TRADITIONAL_GIS_ORDER:
+                crs = crs.Clone()
+                crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
             self.crs = crs
         else:
             self.crs = osr.SpatialReference()
             if self.crs == self.crs.SetFromUserInput(crs):
                 raise ValueError(f"Invalid crs: {crs}")
 
-        # enforce x,y axis ordering
-        self.crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+            # enforce x,y axis ordering
+            self.crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
 
         self.transform = Affine(
             self.pixelsize[0], 0, self.origin[0], 0, -self.pixelsize[1], self.origin[1]
@@ -334,6 +396,34 @@ class GriddedGeoBox:
 
         return (x, y)
 
+    def convert_coordinates_vec(self, ys, xs, centre=True):
+        """Convert arrays of image/array (y, x) indices to real world
+        (map) co-ordinates in a single vectorised pass.
+
+        :param ys:
+            A `numpy.ndarray` of row indices.
+
+        :param xs:
+            A `numpy.ndarray` of column indices.
+
+        :param centre:
+            A boolean indicating if the returned co-ordinates should
+            be offset by 0.5 indicating the centre of a pixel.
+            Default is True.
+
+        :return:
+            A tuple (x, y) of floating point `numpy.ndarray`'s.
+        """
+        offset = 0.5 if centre else 0.0
+        xs = np.asarray(xs, dtype="float64") + offset
+        ys = np.asarray(ys, dtype="float64") + offset
+
+        a, b, c, d, e, f = self.transform[:6]
+        map_x = a * xs + b * ys + c
+        map_y = d * xs + e * ys + f
+
+        return (map_x, map_y)
+
     def transform_coordinates(self, xy, to_crs):
         """Transform a tuple co-ordinate pair (x, y) from one CRS to
         another.
@@ -353,17 +443,45 @@ class GriddedGeoBox:
             err = err.format(type(to_crs))
             raise TypeError(err)
 
-        # ensure we using the traditional x, y axis ordering
-        self.crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-        to_crs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-
-        # Define the transform we are transforming to
-        transform = osr.CoordinateTransformation(self.crs, to_crs)
+        # the cached transformation enforces the traditional x, y axis ordering
+        transform = _coordinate_transformation(
+            self.crs.ExportToWkt(), to_crs.ExportToWkt()
+        )
 
         x, y = self.transform_point(transform, xy)
 
         return (x, y)
 
+    def transform_coordinates_many(self, xs, ys, to_crs):
+        """Transform arrays of x and y co-ordinates from one CRS to
+        another in a single call.
+
+        :param xs:
+            A 1D array of x real world co-ordinates.
+
+        :param ys:
+            A 1D array of y real world co-ordinates.
+
+        :param to_crs:
+            An instance of a defined osr.SpatialReference object.
+
+        :return:
+            A tuple (xs, ys) of floating point `numpy.ndarray`'s.
+        """
+        if not isinstance(to_crs, osr.SpatialReference):
+            err = "Err: to_crs is not an instance of osr.SpatialReference: {}"
+            err = err.format(type(to_crs))
+            raise TypeError(err)
+
+        transform = _coordinate_transformation(
+            self.crs.ExportToWkt(), to_crs.ExportToWkt()
+        )
+
+        points = np.column_stack([np.ravel(xs), np.ravel(ys)]).astype("float64")
+        result = np.array(transform.TransformPoints(points.tolist())).reshape(-1, 3)
+
+        return (result[:, 0], result[:, 1])
+
     def get_pixelsize_metres(self, xy=None):
         """Compute the size (in metres) of the pixel at the specified xy position.
 
@@ -527,8 +645,7 @@ class GriddedGeoBox:
         """Return the upper left corner co-ordinate in geographical
         longitude and latitude degrees based on the WGS84 datum.
         """
-        sr = osr.SpatialReference()
-        sr.SetFromUserInput(CRS)
+        sr = spatial_reference(CRS)
         ul = self.transform_coordinates(self.origin, sr)
         return ul
 
@@ -537,8 +654,7 @@ class GriddedGeoBox:
         """Return the upper right corner co-ordinate in geographical
         longitude and latitude degrees based on the WGS84 datum.
         """
-        sr = osr.SpatialReference()
-        sr.SetFromUserInput(CRS)
+        sr = spatial_reference(CRS)
         ur = self.transform_coordinates(self.ur, sr)
         return ur
 
@@ -547,8 +663,7 @@ class GriddedGeoBox:
         """Return the lower right corner co-ordinate in geographical
         longitude and latitude degrees based on the WGS84 datum.
         """
-        sr = osr.SpatialReference()
-        sr.SetFromUserInput(CRS)
+        sr = spatial_reference(CRS)
         lr = self.transform_coordinates(self.corner, sr)
         return lr
 
@@ -557,8 +672,7 @@ class GriddedGeoBox:
         """Return the lower left corner co-ordinate in geographical
         longitude and latitude degrees based on the WGS84 datum.
         """
-        sr = osr.SpatialReference()
-        sr.SetFromUserInput(CRS)
+        sr = spatial_reference(CRS)
         ll = self.transform_coordinates(self.ll, sr)
         return ll
 
@@ -567,7 +681,6 @@ class GriddedGeoBox:
         """Return the centre co-ordinate in geographical longitude
         and latitude degrees based on the WGS84 datum.
         """
-        sr = osr.SpatialReference()
-        sr.SetFromUserInput(CRS)
+        sr = spatial_reference(CRS)
         centre = self.transform_coordinates(self.centre, sr)
         return centre
@@ -399,19 +399,61 @@ def write_dataframe(
             # forced to make a copies
             dset[col] = data.astype("S").astype([(col, VLEN_STRING)])
 
+    attributes = dataframe_table_attributes(
+        dtype, idx_names, df.shape[0], attrs, dtype_metadata
+    )
+    attach_table_attributes(dset, title=title, attrs=attributes)
+
+
+def dataframe_table_attributes(
+    dtype, index_names, nrows, attrs=None, dtype_metadata=None
+):
+    """
+    Return the attributes that describe a HDF5 `Table` as a
+    `pandas.DataFrame`, such that `read_h5_table` restores it as one.
+    This is the layout written by `write_dataframe`, and allows a
+    structured array laid out the same way (the index fields first)
+    to be written in one go via `write_h5_table`.
+
+    :param dtype:
+        The `NumPy` compound datatype of the table.
+
+    :param index_names:
+        A `list` containing the names of the index fields.
+
+    :param nrows:
+        An `int` containing the number of rows in the table.
+
+    :param attrs:
+        A `dict` of key, value items to be included with the
+        `DataFrame` attributes. The `dict` isn't modified.
+
+    :param dtype_metadata:
+        A `dict` of '<field>_dtype' keys giving the `pandas` datatype
+        name to restore each field as. Fields that aren't included
+        are restored as the field's `NumPy` datatype.
+
+    :return:
+        A `dict` of the attributes.
+    """
     # make a copy so as not to modify the users data
     attributes = {} if attrs is None else attrs.copy()
 
     # insert some basic metadata
-    attributes["index_names"] = numpy.array(idx_names, VLEN_STRING)
+    attributes["index_names"] = numpy.array(index_names, VLEN_STRING)
     attributes["metadata"] = (
         "`Pandas.DataFrame` converted to HDF5 compound " "datatype."
     )
-    attributes["nrows"] = df.shape[0]
+    attributes["nrows"] = nrows
     attributes["python_type"] = "`Pandas.DataFrame`"
-    for key in dtype_metadata:
-        attributes[key] = dtype_metadata[key]
-    attach_table_attributes(dset, title=title, attrs=attributes)
+    for name in dtype.names:
+        key = "{}_dtype".format(name)
+        if dtype_metadata is not None and key in dtype_metadata:
+            attributes[key] = dtype_metadata[key]
+        else:
+            attributes[key] = dtype[name].name
+
+    return attributes
 
 
 def read_h5_table(fid, dataset_name, dataframe=True):
@@ -531,7 +573,6 @@ def h5ls(h5_obj, verbose=False):
             pathname = normpath(ppjoin("/", path))
 
         obj = h5_obj[path]
-        attrs = {k: v for k, v in obj.attrs.items()}
         if isinstance(obj, h5py.Group):
             h5_type = "`Group`"
         elif isinstance(obj, h5py.Dataset):
@@ -545,7 +586,7 @@ def h5ls(h5_obj, verbose=False):
         print("{path}\t{h5_type}".format(path=pathname, h5_type=h5_type))
         if verbose:
             print("Attributes:")
-            pprint(attrs, width=100)
+            pprint(dict(obj.attrs.items()), width=100)
             print("*" * 80)
 
     if isinstance(h5_obj, h5py.Dataset):
@@ -573,7 +614,7 @@ def read_scalar(group, dataset_name):
         attributes coupled with the SCALAR dataset.
     """
     dataset = group[dataset_name]
-    data = {k: v for k, v in dataset.attrs.items()}
+    data = dict(dataset.attrs.items())
     data["value"] = dataset[()]
     return data
 
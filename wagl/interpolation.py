@@ -4,6 +4,7 @@
 
 import logging
 import math
+from functools import lru_cache
 
 import numexpr
 import numpy as np
@@ -46,14 +47,67 @@ def bilinear(shape, fUL, fUR, fLR, fLL, dtype=np.float64):
     :return:
         Array of data values interpolated between corners.
     """
-    s, t = (a.astype(dtype) for a in np.ogrid[0 : shape[0], 0 : shape[1]])
+    out = np.empty(shape, dtype=dtype)
+    bilinear_out(out, fUL, fUR, fLR, fLL)
 
-    s /= shape[0] - 1.0
-    t /= shape[1] - 1.0
+    return out
 
-    result = s * (t * fLR + (1.0 - t) * fLL) + (1.0 - s) * (t * fUR + (1.0 - t) * fUL)
 
-    return result
+@lru_cache(maxsize=64)
+def _bilinear_weights(n, dtype):
+    """Evenly spaced [0, 1] interpolation weights of length `n`.
+    Interpolated grids are made of blocks with only a handful of distinct
+    shapes, so the (read-only) weights are cached per length and dtype.
+    """
+    weights = np.linspace(0.0, 1.0, n, dtype=dtype)
+    weights.flags.writeable = False
+
+    return weights
+
+
+def bilinear_out(out, fUL, fUR, fLR, fLL):
+    """Bilinear interpolation of four scalar values, written into
+    an existing 2D array rather than allocating a new one.
+
+    :param out:
+        Output array (nrows, ncols); its shape defines the grid.
+        May be a view (slice) into a larger grid.
+
+    :param fUL:
+        Data value at upper-left (NW) corner.
+
+    :param fUR:
+        Data value at upper-right (NE) corner.
+
+    :param fLR:
+        Data value at lower-right (SE) corner.
+
+    :param fLL:
+        Data value at lower-left (SW) corner.
+
+    :return:
+        The `out` array.
+    """
+    if not np.issubdtype(out.dtype, np.floating):
+        # weights need a floating point type; interpolate then cast on assignment
+        out[...] = bilinear(out.shape, fUL, fUR, fLR, fLL)
+        return out
+
+    nrows, ncols = out.shape
+
+    # 1D weight vectors; the 2D surface is built from their outer product
+    # so only the (nrows, ncols) output is allocated
+    wy = _bilinear_weights(nrows, out.dtype)[:, np.newaxis]
+    wx = _bilinear_weights(ncols, out.dtype)
+
+    # interpolate along the upper and lower edges, then between them
+    upper = (1.0 - wx) * fUL + wx * fUR
+    lower = (1.0 - wx) * fLL + wx * fLR
+
+    np.multiply(1.0 - wy, upper, out=out)
+    out += wy * lower
+
+    return out
 
 
 def indices(origin=DEFAULT_ORIGIN, shape=DEFAULT_SHAPE):
@@ -135,13 +189,57 @@ def interpolate_block(
     if grid is None:
         return bilinear(shape, fUL, fUR, fLR, fLL)
 
-    grid[i0 : i1 + 1, j0 : j1 + 1] = bilinear(shape, fUL, fUR, fLR, fLL)
+    block = grid[i0 : i1 + 1, j0 : j1 + 1]
+    if block.shape != tuple(shape):
+        msg = f"Block {shape!s} at {origin!s} exceeds grid of shape {grid.shape!s}"
+        raise ValueError(msg)
+
+    bilinear_out(block, fUL, fUR, fLR, fLL)
+
+
+def _bisection_edges(start, size, depth):
+    """Block boundary indices along one axis after `depth` bisections.
+
+    Follows the same split points as :py:func:`subdivide`; adjacent
+    blocks share their boundary index.
+
+    :param start:
+        Index of the first element along the axis.
+
+    :param size:
+        Number of elements along the axis.
+
+    :param depth:
+        Recursive bisection depth.
+
+    :return:
+        1D integer array of length ``2**depth + 1``.
+    """
+    edges = np.array([start, start + size - 1])
+    for _ in range(depth):
+        lower = edges[:-1]
+        split = np.empty(2 * edges.size - 1, dtype=edges.dtype)
+        split[0::2] = edges
+        split[1::2] = lower + (edges[1:] - lower + 1) // 2
+        edges = split
+
+    return edges
 
 
 def interpolate_grid(
-    grid, eval_func, depth=0, origin=DEFAULT_ORIGIN, shape=DEFAULT_SHAPE
+    grid,
+    eval_func,
+    depth=0,
+    origin=DEFAULT_ORIGIN,
+    shape=DEFAULT_SHAPE,
+    vectorized=False,
 ):
-    """Entry function for recursive inplace grid interpolation.
+    """Entry function for inplace grid interpolation via recursive
+    bisection.
+
+    The grid is bisected `depth` times, `eval_func` is evaluated once at
+    each unique block corner, and each block is bilinearly interpolated
+    in place.
 
     :param grid:
         Grid array.
@@ -167,6 +265,13 @@ def interpolate_grid(
         Block shape.
     :type shape:
         :py:class:`tuple` of length 2 ``(nrows, ncols)``.
+
+    :param vectorized:
+        If True, `eval_func` is called once with broadcastable integer
+        arrays of row (nrows, 1) and column (1, ncols) indices, and
+        must return a 2D array of values. Default is False.
+    :type vectorized:
+        :py:class:`bool`
     """
     # bilinear requires a 2 by 2 grid at a minimum;
     #  depth can be derived by bit length
@@ -179,45 +284,36 @@ def interpolate_grid(
             f" using {max_depth} for shape {shape!s}"
         )
         depth = max_depth
-    return __interpolate_grid_inner(grid, eval_func, depth, origin, shape)
-
-
-def __interpolate_grid_inner(grid, eval_func, depth, origin, shape):
-    """Recursive calls to interpolate a gridded dataset
-    Interpolation is performed inplace to the provided grid.
-
-    :param grid:
-        Grid array.
-    :type grid:
-        :py:class:`numpy.array`.
-
-    :param eval_func:
-        Evaluator function.
-    :type eval_func:
-        callable; accepts grid indices i, j and returns a scalar value.
 
-    :param depth:
-        Recursive bisection depth.
-    :type depth:
-        :py:class:`int`
+    rows = _bisection_edges(origin[0], shape[0], depth)
+    cols = _bisection_edges(origin[1], shape[1], depth)
 
-    :param origin:
-        Block origin,
-    :type origin:
-        :py:class:`tuple` of length 2.
-
-    :param shape:
-        Block shape.
-    :type shape:
-        :py:class:`tuple` of length 2 ``(nrows, ncols)``.
-    """
-    if depth == 0:
-        interpolate_block(origin, shape, eval_func, grid)
+    # corners are shared by neighbouring blocks, so evaluate each only once
+    if vectorized:
+        values = np.asarray(eval_func(rows[:, np.newaxis], cols[np.newaxis, :]))
     else:
-        blocks = subdivide(origin, shape)
-        for kUL, _, _, kLR in blocks.values():
-            block_shape = (kLR[0] - kUL[0] + 1, kLR[1] - kUL[1] + 1)
-            __interpolate_grid_inner(grid, eval_func, depth - 1, kUL, block_shape)
+        row_ids = rows.tolist()
+        col_ids = cols.tolist()
+        values = np.fromiter(
+            (eval_func(i, j) for i in row_ids for j in col_ids),
+            dtype="float64",
+            count=rows.size * cols.size,
+        ).reshape(rows.size, cols.size)
+
+    for r, (i0, i1) in enumerate(zip(rows[:-1].tolist(), rows[1:].tolist())):
+        for c, (j0, j1) in enumerate(zip(cols[:-1].tolist(), cols[1:].tolist())):
+            block = grid[i0 : i1 + 1, j0 : j1 + 1]
+            if block.shape != (i1 - i0 + 1, j1 - j0 + 1):
+                msg = "Block at {} exceeds grid of shape {!s}"
+                raise ValueError(msg.format((i0, j0), grid.shape))
+
+            bilinear_out(
+                block,
+                values[r, c],
+                values[r, c + 1],
+                values[r + 1, c + 1],
+                values[r + 1, c],
+            )
 
 
 def sheared_bilinear_interpolate(
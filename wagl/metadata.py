@@ -14,6 +14,7 @@ except ImportError:
 import os
 import socket
 import uuid
+from functools import lru_cache
 from posixpath import join as ppjoin
 
 import fiona
@@ -22,6 +23,7 @@ import numpy as np
 import pandas as pd
 import rasterio
 import yaml
+from shapely import STRtree
 from shapely.geometry import Polygon, shape
 from yaml.representer import Representer
 
@@ -118,6 +120,15 @@ def read_metadata_tags(fname, bands):
     return pd.DataFrame(tag_data)
 
 
+@lru_cache(maxsize=4)
+def _offshore_territory_boundaries(offshore_territory_boundary_path: str) -> STRtree:
+    """The boundary polygons, read once per file and indexed by extent."""
+    with fiona.open(offshore_territory_boundary_path, "r") as offshore_territory:
+        return STRtree(
+            [shape(boundary_poly["geometry"]) for boundary_poly in offshore_territory]
+        )
+
+
 def is_offshore_territory(
     acq: Acquisition, offshore_territory_boundary_path: str
 ) -> bool:
@@ -126,12 +137,10 @@ def is_offshore_territory(
         [geobox.ul_lonlat, geobox.ur_lonlat, geobox.lr_lonlat, geobox.ll_lonlat]
     )
 
-    with fiona.open(offshore_territory_boundary_path, "r") as offshore_territory:
-        for boundary_poly in offshore_territory:
-            if shape(boundary_poly["geometry"]).contains(acq_polygon):
-                return False
-
-    return True
+    # only the boundaries whose extents cover the acquisition are tested,
+    # for a boundary that contains the acquisition
+    boundaries = _offshore_territory_boundaries(offshore_territory_boundary_path)
+    return len(boundaries.query(acq_polygon, predicate="within")) == 0
 
 
 def create_ard_yaml(
@@ -44,16 +44,12 @@ def convert_to_lonlat(geobox, col_index, row_index, centre=True):
     sr = osr.SpatialReference()
     sr.SetFromUserInput(CRS)
 
-    lon = np.zeros(row_index.shape, dtype="float64")
-    lat = np.zeros(row_index.shape, dtype="float64")
+    # image to map co-ordinates for all indices at once
+    map_x, map_y = geobox.convert_coordinates_vec(row_index, col_index, centre=centre)
 
-    for i, coord in enumerate(zip(col_index, row_index)):
-        map_xy = geobox.convert_coordinates(coord, centre=centre)
-        lonlat = geobox.transform_coordinates(map_xy, to_crs=sr)
-        lon[i] = lonlat[0]
-        lat[i] = lonlat[1]
+    lon, lat = geobox.transform_coordinates_many(map_x, map_y, to_crs=sr)
 
-    return lon, lat
+    return lon.reshape(row_index.shape), lat.reshape(row_index.shape)
 
 
 def create_centreline_dataset(geobox, x, n, out_group):